@@ -21,10 +21,8 @@ const getAuthHeader = () => {
   return `Basic ${auth}`;
 };
 
-// MCP endpoint
-app.post('/mcp/v1/tools/call', async (req, res) => {
-  const { method, params, id } = req.body;
-  
+// Handle a single JSON-RPC tools/call request and return its response object
+const handleToolCall = async ({ method, params, id } = {}) => {
   console.log(`\n[MCP Server] Received request:`, JSON.stringify({ method, params }, null, 2));
   
   try {
@@ -58,22 +56,32 @@ app.post('/mcp/v1/tools/call', async (req, res) => {
         throw new Error(`Unknown tool: ${toolName}`);
     }
     
-    res.json({
+    return {
       jsonrpc: '2.0',
       result,
       id
-    });
+    };
     
   } catch (error) {
     console.error('[MCP Server] Error:', error.message);
-    res.json({
+    return {
       jsonrpc: '2.0',
       error: {
         code: -32603,
         message: error.message
       },
       id
-    });
+    };
+  }
+};
+
+// MCP endpoint; a JSON-RPC batch (array body) is answered with an array of
+// responses, with the calls run concurrently
+app.post('/mcp/v1/tools/call', async (req, res) => {
+  if (Array.isArray(req.body)) {
+    res.json(await Promise.all(req.body.map((request) => handleToolCall(request))));
+  } else {
+    res.json(await handleToolCall(req.body));
   }
 });
 
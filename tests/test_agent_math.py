@@ -7,7 +7,7 @@ from weaver_ai.mcp import MCPClient
 from weaver_ai.model_router import StubModel
 from weaver_ai.security.auth import UserContext
 from weaver_ai.settings import AppSettings
-from weaver_ai.tools import create_python_eval_server
+from weaver_ai.tools import PythonEvalTool, create_python_eval_server
 from weaver_ai.verifier import Verifier
 
 
@@ -34,3 +34,39 @@ def test_agent_math_forbidden():
     user = UserContext(user_id="u", roles=[])
     with pytest.raises(Exception):  # noqa: B017
         agent.ask("2+3", "u", user)
+
+
+def test_python_eval_template_reuse():
+    tool = PythonEvalTool()
+    assert tool.call(expr="2 * (3 + 4)") == {"result": 14}
+    # Same shape, different numbers: served by the compiled template
+    assert tool.call(expr="5 * (1 + 0.5)") == {"result": 7.5}
+    assert "# * (# + #)" in PythonEvalTool._template_cache
+
+
+def test_python_eval_template_keeps_guards():
+    tool = PythonEvalTool()
+    assert tool.call(expr="4/2") == {"result": 2.0}
+    with pytest.raises(ValueError, match="Division by zero"):
+        tool.call(expr="4/0")
+    assert tool.call(expr="2**3") == {"result": 8}
+    with pytest.raises(ValueError, match="Exponent too large"):
+        tool.call(expr="2**101")
+    with pytest.raises(ValueError, match="Invalid expression"):
+        tool.call(expr="07+1")
+
+
+@pytest.mark.parametrize(
+    ("query", "tool_required"),
+    [
+        ("2+3", True),
+        ("hello", False),
+        ("what is the weather like in paris this week", False),
+        ("please work out the total of forty two and 8 apples", True),
+        ("quelle est la météo à paris cette semaine s'il vous plaît", False),
+        ("combien font quarante-deux et huit s'il vous plaît, merci", True),
+    ],
+)
+def test_verifier_detects_calculation_queries(query, tool_required):
+    result = Verifier().verify(query, "answer", [], [])
+    assert result.tool_required is tool_required
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import time
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -11,6 +14,7 @@ from pydantic import BaseModel
 from weaver_ai.agents.base import BaseAgent, Result
 from weaver_ai.agents.tool_manager import AgentToolManager, ToolExecutionPlan
 from weaver_ai.events import Event
+from weaver_ai.security.rbac import check_access
 from weaver_ai.tools import ToolRegistry
 from weaver_ai.tools.base import Tool, ToolExecutionContext, ToolResult
 from weaver_ai.tools.builtin import DocumentationTool, WebSearchTool
@@ -229,6 +233,54 @@ async def test_tool_parallel_execution():
     assert results[1].tool_name == "documentation"
 
 
+@pytest.mark.asyncio
+async def test_registry_execute_many():
+    """Test concurrent execution of several calls through the registry."""
+    registry = ToolRegistry()
+    await registry.register_tool(DocumentationTool())
+
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    results = await registry.execute_many(
+        [
+            ("documentation", {"library": "asyncio"}),
+            ("missing_tool", {}),
+            ("documentation", {"library": "httpx"}),
+        ],
+        context,
+        check_permissions=False,
+        max_concurrency=2,
+    )
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[0].data["library"] == "asyncio"
+    assert results[2].data["library"] == "httpx"
+
+
+@pytest.mark.asyncio
+async def test_registry_memoizes_permission_checks(tmp_path):
+    """Test that RBAC verdicts are reused until the role file changes."""
+    roles_path = tmp_path / "roles.yaml"
+    roles_path.write_text("user:\n  - tool:documentation\n")
+    registry = ToolRegistry(roles_path=roles_path)
+    await registry.register_tool(DocumentationTool())
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    with patch("weaver_ai.tools.registry.check_access", wraps=check_access) as checked:
+        for _ in range(3):
+            result = await registry.execute_tool(
+                "documentation", {"library": "httpx"}, context
+            )
+            assert result.error.startswith("Permission denied")
+        assert checked.call_count == 1
+
+        roles_path.write_text("user:\n  - tool:web_search\n")
+        mtime_ns = roles_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(roles_path, ns=(mtime_ns, mtime_ns))
+        await registry.execute_tool("documentation", {"library": "httpx"}, context)
+        assert checked.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_tool_sequential_execution():
     """Test sequential tool execution with context passing."""
@@ -324,6 +376,152 @@ async def test_tool_caching():
     assert result2.cached is True
 
 
+@pytest.mark.asyncio
+async def test_tool_cache_bounds_and_expiry():
+    """Test that the result cache is size-bounded and honours the TTL."""
+    registry = ToolRegistry(cache_max_entries=2)
+    tool = DocumentationTool()
+    await registry.register_tool(tool)
+
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    for library in ("a", "b", "c"):
+        await registry.execute_tool(
+            "documentation", {"library": library}, context, check_permissions=False
+        )
+    assert len(registry._cache) == 2
+    assert registry._cache_by_tool["documentation"] == set(registry._cache)
+
+    tool.cache_ttl = 0
+    await registry.execute_tool(
+        "documentation", {"library": "d"}, context, check_permissions=False
+    )
+    result = await registry.execute_tool(
+        "documentation", {"library": "d"}, context, check_permissions=False
+    )
+    assert result.cached is False
+
+    await registry.unregister_tool("documentation")
+    assert not registry._cache
+    assert not registry._cache_by_tool
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_execution():
+    """Test that duplicate in-flight calls await a single execution."""
+    registry = ToolRegistry()
+    calls = []
+
+    class CountingTool(Tool):
+        name: str = "counting_tool"
+        description: str = "Counts its executions"
+
+        async def execute(self, args, context):
+            calls.append(args)
+            await asyncio.sleep(0.01)
+            return ToolResult(
+                success=True, data=args["q"], execution_time=0, tool_name=self.name
+            )
+
+    await registry.register_tool(CountingTool())
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    results = await asyncio.gather(
+        *(
+            registry.execute_tool(
+                "counting_tool", {"q": q}, context, check_permissions=False
+            )
+            for q in ("a", "a", "a", "b")
+        )
+    )
+
+    assert len(calls) == 2
+    assert [r.data for r in results] == ["a", "a", "a", "b"]
+    # Each caller gets its own copy of the shared result
+    assert results[0] is not results[1]
+    assert not registry._inflight
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters():
+    """Test that waiters take over when the executing call is cancelled."""
+    registry = ToolRegistry()
+    calls = []
+    started = asyncio.Event()
+
+    class SlowTool(Tool):
+        name: str = "slow_tool"
+        description: str = "Blocks on its first execution"
+
+        async def execute(self, args, context):
+            calls.append(args)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return ToolResult(
+                success=True, data=args["q"], execution_time=0, tool_name=self.name
+            )
+
+    await registry.register_tool(SlowTool())
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    def call():
+        return registry.execute_tool(
+            "slow_tool", {"q": "a"}, context, check_permissions=False
+        )
+
+    leader = asyncio.create_task(call())
+    await started.wait()
+    waiters = [asyncio.create_task(call()) for _ in range(2)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    results = await asyncio.gather(*waiters)
+
+    assert leader.cancelled()
+    assert [r.data for r in results] == ["a", "a"]
+    assert len(calls) == 2
+    assert not registry._inflight
+
+
+@pytest.mark.asyncio
+async def test_cached_results_are_returned_as_copies():
+    """Test that marking a hit as cached leaves the cache entry untouched."""
+    registry = ToolRegistry()
+    await registry.register_tool(DocumentationTool())
+    context = ToolExecutionContext(agent_id="test-agent", user_id="test-user")
+
+    def call():
+        return registry.execute_tool(
+            "documentation", {"library": "a"}, context, check_permissions=False
+        )
+
+    first = await call()
+    second = await call()
+    third = await call()
+
+    assert first.cached is False
+    assert second.cached is True and third.cached is True
+    assert second is not third
+    assert all(entry.cached is False for _, _, entry in registry._cache.values())
+
+
+def test_tool_cache_expires_due_entries_only():
+    """Test that the expiry heap drops only due, still-current entries."""
+    registry = ToolRegistry()
+    result = ToolResult(success=True, data=None, execution_time=0, tool_name="t")
+
+    registry._cache_put("t", "stale", result, ttl=0)
+    registry._cache_put("t", "fresh", result, ttl=60)
+    registry._cache_put("t", "rewritten", result, ttl=0)
+    registry._cache_put("t", "rewritten", result, ttl=60)
+
+    registry._expire_due(time.monotonic())
+
+    assert set(registry._cache) == {"fresh", "rewritten"}
+    assert registry._cache_by_tool["t"] == {"fresh", "rewritten"}
+
+
 @pytest.mark.asyncio
 async def test_tool_error_handling():
     """Test tool error handling."""
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
+
 from fastapi.testclient import TestClient
 
 from weaver_ai import gateway
+from weaver_ai.security import policy
 from weaver_ai.settings import AppSettings
 
 
@@ -30,3 +33,19 @@ def test_pii_redact():
     )
     assert r.status_code == 200
     assert "[redacted]" in r.json()["answer"]
+
+
+def test_policies_are_reparsed_only_when_file_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "guardrails.yaml"
+    path.write_text("deny_patterns:\n  - forbidden\n")
+
+    first = policy.load_policies(path)
+    assert policy.load_policies(path) is first
+    assert first == {"deny_patterns": ["forbidden"]}
+
+    path.write_text("deny_patterns:\n  - blocked\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert policy.load_policies(path) == {"deny_patterns": ["blocked"]}
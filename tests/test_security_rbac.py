@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import os
+
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from weaver_ai import gateway
+from weaver_ai.security.auth import UserContext
+from weaver_ai.security.rbac import check_access, load_roles
 from weaver_ai.settings import AppSettings
 
 
@@ -19,3 +25,20 @@ def test_rbac_forbidden():
         "/ask", headers={"x-api-key": "k"}, json={"user_id": "u", "query": "2+2"}
     )
     assert r.status_code == 403
+
+
+def test_roles_reload_when_file_changes(tmp_path):
+    roles_path = tmp_path / "roles.yaml"
+    roles_path.write_text("user:\n  - tool:python_eval\n")
+    user = UserContext(user_id="u", roles=["user"])
+
+    check_access(user, "tool:python_eval", roles_path=roles_path)
+    assert load_roles(roles_path) is load_roles(roles_path)
+
+    roles_path.write_text("user:\n  - tool:web_search\n")
+    stat = roles_path.stat()
+    os.utime(roles_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    with pytest.raises(HTTPException):
+        check_access(user, "tool:python_eval", roles=load_roles(roles_path))
+    check_access(user, "tool:web_search", roles_path=roles_path)
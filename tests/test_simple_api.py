@@ -227,6 +227,40 @@ class TestRunners:
         config = flaky_agent._agent_config
         assert config["retry"] == 3
 
+    def test_serve_process_endpoint(self):
+        """Test the /process endpoint of a served agent."""
+        from fastapi.testclient import TestClient
+
+        from weaver_ai.simple import serve
+
+        @agent
+        async def shout(text: str) -> str:
+            return text.upper()
+
+        client = TestClient(serve(shout, start=False))
+
+        response = client.post("/process", json={"input": "hi"})
+        assert response.status_code == 200
+        assert response.json() == {"output": "HI", "success": True, "error": None}
+
+    def test_serve_process_endpoint_encodes_non_json_types(self):
+        """Test that /process JSON-encodes Decimals, sets and int keys."""
+        from decimal import Decimal
+
+        from fastapi.testclient import TestClient
+
+        from weaver_ai.simple import serve
+
+        @agent
+        async def describe(text: str) -> dict:
+            return {1: text, "d": Decimal("1.5"), "s": {1}}
+
+        client = TestClient(serve(describe, start=False))
+
+        response = client.post("/process", json={"input": "a"})
+        assert response.status_code == 200
+        assert response.json()["output"] == {"1": "a", "d": "1.5", "s": [1]}
+
 
 # =============================================================================
 # Test Type-Based Routing
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,8 +12,14 @@ import pytest
 from pydantic import BaseModel
 
 from weaver_ai.agents import BaseAgent, agent
+from weaver_ai.agents.error_handling import FailFast
 from weaver_ai.events import Event
-from weaver_ai.workflow import Workflow, WorkflowResult, WorkflowState
+from weaver_ai.workflow import (
+    Workflow,
+    WorkflowResult,
+    WorkflowState,
+    _iso_timestamp,
+)
 
 
 # Test data models
@@ -160,6 +168,32 @@ class TestWorkflow:
         # Result should be DataC after going through both agents
         assert isinstance(result.result, DataB | DataC)
 
+    @pytest.mark.asyncio
+    async def test_agent_results_are_collected_per_run(self):
+        """Test that outputs land in agent_results, not in agent_instances."""
+
+        @agent
+        class CountingAgent(BaseAgent):
+            async def process(self, event: Event) -> InputData:
+                return InputData(value=event.data.value + 1, text="count")
+
+        workflow = (
+            Workflow("agent_results_test")
+            .add_agent(CountingAgent, instance_id="counter")
+            .add_route(lambda r: r.value < 3, from_agent="counter", to_agent="counter")
+        )
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(CountingAgent, "initialize", new=AsyncMock()):
+                result = await workflow.run(InputData(value=0, text="start"))
+
+        assert result.result.value == 3
+        assert result.agent_results == {"counter": result.result}
+        assert isinstance(workflow.agent_instances["counter"], CountingAgent)
+
     @pytest.mark.asyncio
     async def test_manual_routing_override(self):
         """Test manual routing overrides automatic type-based routing."""
@@ -240,6 +274,24 @@ class TestWorkflow:
                     with pytest.raises(RuntimeError, match="This agent always fails"):
                         await workflow.run(InputData(value=1, text="test"))
 
+    @pytest.mark.asyncio
+    async def test_fail_fast_calls_agent_directly(self):
+        """Test that passthrough strategies skip the execute() wrapper."""
+        workflow = Workflow("passthrough_test").add_agent(
+            ProcessorAgent, error_handling="fail_fast"
+        )
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(ProcessorAgent, "initialize", new=AsyncMock()):
+                with patch.object(FailFast, "execute", new=AsyncMock()) as execute:
+                    result = await workflow.run(InputData(value=2, text="t"))
+
+        execute.assert_not_awaited()
+        assert result.result.processed_value == 4
+
     @pytest.mark.asyncio
     async def test_error_handling_skip(self):
         """Test skip-on-error handling strategy."""
@@ -284,8 +336,8 @@ class TestWorkflow:
         """Test workflow observability events."""
         published_events = []
 
-        async def mock_publish(event_type, data):
-            published_events.append((event_type, data))
+        async def mock_publish_many(events):
+            published_events.extend(events)
 
         workflow = (
             Workflow("observability_test")
@@ -297,7 +349,7 @@ class TestWorkflow:
             mesh_instance = mock_mesh.return_value
             mesh_instance.connect = AsyncMock()
             mesh_instance.close = AsyncMock()
-            mesh_instance.publish = mock_publish
+            mesh_instance.publish_many = mock_publish_many
 
             with patch.object(ProcessorAgent, "initialize", new=AsyncMock()):
                 with patch.object(AggregatorAgent, "initialize", new=AsyncMock()):
@@ -307,6 +359,90 @@ class TestWorkflow:
         assert len(published_events) > 0
         assert any("workflow.progress" in event[0] for event in published_events)
 
+    @pytest.mark.asyncio
+    async def test_workflow_progress_is_batched(self):
+        """Test that progress events are flushed in batches, best-effort."""
+        batches = []
+
+        async def mock_publish_many(events):
+            batches.append(list(events))
+            raise ConnectionError("redis down")
+
+        workflow = (
+            Workflow("batched_progress_test")
+            .add_agents(ProcessorAgent, AggregatorAgent)
+            .add_route(
+                when=lambda result: result is not None,
+                from_agent="processoragent",
+                to_agent="aggregatoragent",
+            )
+            .with_observability(True)
+        )
+        workflow.PROGRESS_FLUSH_INTERVAL = 60
+        workflow.PROGRESS_BATCH_SIZE = 1
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mesh_instance = mock_mesh.return_value
+            mesh_instance.connect = AsyncMock()
+            mesh_instance.close = AsyncMock()
+            mesh_instance.publish_many = mock_publish_many
+
+            with patch.object(ProcessorAgent, "initialize", new=AsyncMock()):
+                with patch.object(AggregatorAgent, "initialize", new=AsyncMock()):
+                    result = await workflow.run(InputData(value=1, text="test"))
+
+        # Nothing is sent per hop; cleanup flushes the buffer in batches
+        assert result.state == WorkflowState.COMPLETED
+        assert [[e[1]["agent_id"] for e in b] for b in batches] == [
+            ["processoragent"],
+            ["aggregatoragent"],
+        ]
+        assert workflow._progress_buffer == []
+        event = batches[0][0][1]
+        seconds, nanos = divmod(event["timestamp_ns"], 1_000_000_000)
+        assert (
+            event["timestamp"]
+            == datetime.fromtimestamp(seconds, UTC)
+            .replace(microsecond=nanos // 1000)
+            .isoformat()
+        )
+
+    def test_progress_timestamps_match_isoformat(self):
+        """Test that cached-prefix timestamps format like datetime.isoformat."""
+        for timestamp_ns in (0, 1_700_000_000_123_456_789, 1_700_000_001_000_000_000):
+            seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+            expected = datetime.fromtimestamp(seconds, UTC).replace(
+                microsecond=nanos // 1000
+            )
+            assert _iso_timestamp(timestamp_ns) == expected.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_workflow_progress_stream_sink(self):
+        """Test that progress can be appended to a per-workflow stream."""
+        workflow = (
+            Workflow("stream_progress_test")
+            .add_agents(ProcessorAgent)
+            .with_observability(True, sink="stream")
+        )
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mesh_instance = mock_mesh.return_value
+            mesh_instance.connect = AsyncMock()
+            mesh_instance.close = AsyncMock()
+            mesh_instance.add_to_stream_many = AsyncMock()
+            mesh_instance.publish_many = AsyncMock()
+
+            with patch.object(ProcessorAgent, "initialize", new=AsyncMock()):
+                await workflow.run(InputData(value=1, text="test"))
+
+        stream, entries = mesh_instance.add_to_stream_many.await_args.args
+        assert stream == f"workflow.progress.{workflow.workflow_id}"
+        assert entries[0]["agent_id"] == "processoragent"
+        mesh_instance.publish_many.assert_not_awaited()
+
+        with pytest.raises(ValueError, match="Unknown progress sink"):
+            workflow.with_observability(True, sink="kafka")
+
     @pytest.mark.asyncio
     async def test_workflow_intervention(self):
         """Test workflow intervention capability."""
@@ -331,6 +467,32 @@ class TestWorkflow:
         # Intervention should have been checked
         assert mock_intervention.called
 
+    @pytest.mark.asyncio
+    async def test_intervention_requests_are_queued_from_the_mesh(self):
+        """Test that interventions arrive by subscription, not per-hop polling."""
+        workflow = (
+            Workflow("intervention_queue_test")
+            .add_agents(ProcessorAgent, AggregatorAgent)
+            .with_intervention(True)
+        )
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.subscribe = AsyncMock()
+            await workflow._initialize()
+
+        patterns, handler = mock_mesh.return_value.subscribe.await_args.args
+        assert patterns == [f"channel:{workflow.intervention_channel}"]
+
+        workflow.agent_instances = {"aggregatoragent": MagicMock()}
+        handler(Event(event_type="dict", data={"agent_id": "unknown"}))
+        handler(Event(event_type="dict", data={"agent_id": "aggregatoragent"}))
+
+        assert await workflow._check_intervention("processor", None) == (
+            "aggregatoragent"
+        )
+        assert await workflow._check_intervention("processor", None) is None
+
     @pytest.mark.asyncio
     async def test_concurrent_workflows(self):
         """Test multiple workflows running concurrently."""
@@ -422,6 +584,182 @@ class TestWorkflow:
         assert result.end_time is not None
         assert result.state is not None
 
+    def test_agent_config_lookup(self):
+        """Test that agent configs are found by instance ID."""
+        workflow = (
+            Workflow("config_lookup_test")
+            .add_agent(ProcessorAgent, instance_id="first", model="mock")
+            .add_agent(AggregatorAgent, instance_id="second")
+            .add_agent(AggregatorAgent, instance_id="first")
+        )
+
+        assert workflow._get_agent_config("second") is workflow.agents[1]
+        # The first registration of an instance ID is the one used
+        assert workflow._get_agent_config("first").model_name == "mock"
+        with pytest.raises(ValueError, match="No configuration for agent"):
+            workflow._get_agent_config("missing")
+
+    def test_type_routing_is_memoized(self):
+        """Test that each data type is routed through the type router once."""
+        workflow = Workflow("route_cache_test")
+        workflow.type_router = MagicMock()
+        workflow.type_router.find_agent_for_type.side_effect = lambda t: (
+            "processor" if t is InputData else None
+        )
+
+        for _ in range(3):
+            assert workflow._find_agent_for_type(InputData) == "processor"
+            assert workflow._find_agent_for_type(FinalResult) is None
+
+        assert workflow.type_router.find_agent_for_type.call_count == 2
+
+        # Rebuilding the router starts from an empty cache
+        workflow._setup_routing()
+        assert workflow._route_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_routes_are_checked_by_priority_per_source(self):
+        """Test that only routes leaving the current agent are considered."""
+        workflow = (
+            Workflow("route_bucket_test")
+            .add_route(lambda r: True, from_agent="a", to_agent="low", priority=1)
+            .add_route(lambda r: True, from_agent="b", to_agent="other", priority=9)
+            .add_route(lambda r: r == "go", from_agent="a", to_agent="high", priority=5)
+        )
+
+        assert await workflow._find_next_agent("a", "go", None) == "high"
+        assert await workflow._find_next_agent("a", "stop", None) == "low"
+        assert await workflow._find_next_agent("c", None, None) is None
+        assert [r.to_agent for r in workflow.routes] == ["other", "high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_type_and_unconditional_routes(self):
+        """Test that type routes match unwrapped output and None always routes."""
+        workflow = (
+            Workflow("type_route_test")
+            .add_route(None, from_agent="a", to_agent="fallback")
+            .add_type_route("a", "processor", ProcessedData, priority=5)
+        )
+        processed = ProcessedData(original_value=1, processed_value=2, message="m")
+
+        assert await workflow._find_next_agent("a", processed, None) == "processor"
+        wrapped = MagicMock(data=processed)
+        assert await workflow._find_next_agent("a", wrapped, None) == "processor"
+        assert await workflow._find_next_agent("a", "text", None) == "fallback"
+
+    @pytest.mark.asyncio
+    async def test_agents_initialize_concurrently(self):
+        """Test that agents initialize together and failures keep the rest."""
+        started = asyncio.Event()
+
+        async def processor_init(self, **kwargs):
+            # Completes only if the aggregator is initializing at the same time
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+        async def aggregator_init(self, **kwargs):
+            started.set()
+            raise ConnectionError("model unavailable")
+
+        workflow = Workflow("concurrent_init_test").add_agents(
+            ProcessorAgent, AggregatorAgent
+        )
+
+        with patch.object(ProcessorAgent, "initialize", new=processor_init):
+            with patch.object(AggregatorAgent, "initialize", new=aggregator_init):
+                with pytest.raises(ConnectionError, match="model unavailable"):
+                    await workflow._create_agents()
+
+        # The agent that did initialize is kept so cleanup can release it
+        assert list(workflow.agent_instances) == ["processoragent"]
+
+    @pytest.mark.asyncio
+    async def test_agent_init_concurrency_is_capped(self):
+        """Test that no more than MAX_CONCURRENT_INITS agents start at once."""
+        active = []
+        peak = 0
+
+        async def tracked_init(self, **kwargs):
+            nonlocal peak
+            active.append(self)
+            peak = max(peak, len(active))
+            await asyncio.sleep(0.01)
+            active.remove(self)
+
+        workflow = Workflow("capped_init_test").add_agents(
+            ProcessorAgent, AggregatorAgent
+        )
+        workflow.MAX_CONCURRENT_INITS = 1
+
+        with patch.object(ProcessorAgent, "initialize", new=tracked_init):
+            with patch.object(AggregatorAgent, "initialize", new=tracked_init):
+                await workflow._create_agents()
+
+        assert peak == 1
+        assert len(workflow.agent_instances) == 2
+
+    @pytest.mark.asyncio
+    async def test_result_cache_skips_repeated_agent_work(self):
+        """Test that opted-in workflows reuse results for equal inputs."""
+        calls = []
+
+        @agent
+        class CountingAgent(BaseAgent):
+            async def process(self, event: Event) -> ProcessedData:
+                calls.append(event.data)
+                return ProcessedData(
+                    original_value=event.data.value,
+                    processed_value=event.data.value * 2,
+                    message=event.data.text,
+                )
+
+        workflow = Workflow("result_cache_test").add_agent(CountingAgent)
+        workflow.with_result_cache()
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(CountingAgent, "initialize", new=AsyncMock()):
+                first = await workflow.run(InputData(value=3, text="a"))
+                second = await workflow.run(InputData(value=3, text="a"))
+                third = await workflow.run(InputData(value=4, text="a"))
+
+        assert first.result == second.result
+        assert third.result.processed_value == 8
+        assert len(calls) == 2
+
+        workflow.with_result_cache(False)
+        assert workflow._result_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_routing_cycles_fail_after_max_revisits(self):
+        """Test that a self-routing agent fails the run past its revisits."""
+        calls = []
+
+        @agent
+        class LoopingAgent(BaseAgent):
+            async def process(self, event: Event) -> InputData:
+                calls.append(event.data)
+                return InputData(value=event.data.value + 1, text="loop")
+
+        workflow = (
+            Workflow("loop_test")
+            .add_agent(LoopingAgent, instance_id="looper")
+            .add_route(lambda result: True, from_agent="looper", to_agent="looper")
+        )
+        workflow.with_max_revisits(4)
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(LoopingAgent, "initialize", new=AsyncMock()):
+                result = await workflow.run(InputData(value=0, text="start"))
+
+        assert len(calls) == 5
+        assert result.state == WorkflowState.FAILED
+        assert "'looper' ran 5 times" in result.error
+
     @pytest.mark.asyncio
     async def test_empty_workflow(self):
         """Test workflow with no agents."""
@@ -462,6 +800,66 @@ class TestWorkflow:
         # Cleanup should have been called
         assert cleanup_called
 
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_inside_context(self):
+        """Test that runs inside `async with` share one mesh connection."""
+        workflow = Workflow("reuse_test").add_agent(ProcessorAgent)
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(ProcessorAgent, "initialize", new=AsyncMock()):
+                async with workflow:
+                    for value in (1, 2):
+                        result = await workflow.run(InputData(value=value, text="t"))
+                        assert result.state == WorkflowState.COMPLETED
+                    mock_mesh.return_value.close.assert_not_awaited()
+
+                # Outside the block each run connects and closes again
+                await workflow.run(InputData(value=3, text="t"))
+
+        assert mock_mesh.call_count == 2
+        assert mock_mesh.return_value.close.await_count == 2
+        assert workflow.mesh is None
+
+    @pytest.mark.asyncio
+    async def test_workflow_cleanup_continues_after_failure(self):
+        """Test that one agent's failed cleanup does not skip the others."""
+        cleaned = []
+
+        @agent
+        class BrokenCleanupAgent(BaseAgent):
+            async def process(self, event: Event) -> None:
+                return None
+
+            async def cleanup(self):
+                raise ConnectionError("already closed")
+
+        @agent
+        class TidyAgent(BaseAgent):
+            async def process(self, event: Event) -> None:
+                return None
+
+            async def cleanup(self):
+                cleaned.append(self)
+
+        workflow = Workflow("cleanup_failure_test").add_agents(
+            BrokenCleanupAgent, TidyAgent
+        )
+
+        with patch("weaver_ai.workflow.RedisEventMesh") as mock_mesh:
+            mock_mesh.return_value.connect = AsyncMock()
+            mock_mesh.return_value.close = AsyncMock()
+
+            with patch.object(BrokenCleanupAgent, "initialize", new=AsyncMock()):
+                with patch.object(TidyAgent, "initialize", new=AsyncMock()):
+                    result = await workflow.run(InputData(value=1, text="test"))
+
+        assert result.state == WorkflowState.COMPLETED
+        assert len(cleaned) == 1
+        mock_mesh.return_value.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_per_agent_model_configuration(self):
         """Test that agents can have different models configured."""
@@ -542,6 +940,45 @@ class TestWorkflow:
                     assert call_args[1]["model_name"] == "gpt-4"
                     assert call_args[1]["api_key"] is None
 
+    @pytest.mark.asyncio
+    async def test_agent_routers_are_shared_without_touching_environ(self):
+        """Test that BYOK keys go to adapters, not os.environ, and are reused."""
+        workflow = Workflow("router_cache_test")
+
+        with patch.dict("os.environ", {}, clear=True):
+            gpt = await workflow._create_agent_router("gpt-4", "sk-a", {})
+            again = await workflow._create_agent_router("gpt-4", "sk-a", {})
+            other_key = await workflow._create_agent_router("gpt-4", "sk-b", {})
+            claude = await workflow._create_agent_router("claude-3-opus", "sk-ant", {})
+
+            assert "OPENAI_API_KEY" not in os.environ
+            assert "ANTHROPIC_API_KEY" not in os.environ
+
+        assert gpt is again
+        assert other_key is not gpt
+        assert gpt.adapters["gpt-4"].api_key == "sk-a"
+        assert claude.adapters["claude-3-opus"].api_key == "sk-ant"
+        assert claude.adapters["claude-3-opus"].default_model == "claude-3-opus"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("model_name", "adapter_name"),
+        [
+            ("GPT-4", "mock_GPT-4"),
+            ("claude-3-haiku", "mock_claude-3-haiku"),
+            ("mock-fast", "mock-fast"),
+            ("llama-3", "mock_llama-3"),
+        ],
+    )
+    async def test_agent_router_falls_back_to_mock(self, model_name, adapter_name):
+        """Test adapter selection when no API key is available."""
+        workflow = Workflow("router_dispatch_test")
+
+        with patch.dict("os.environ", {}, clear=True):
+            router = await workflow._create_agent_router(model_name, None, {})
+
+        assert router.adapters[model_name].name == adapter_name
+
     @pytest.mark.asyncio
     async def test_workflow_with_model_config(self):
         """Test workflow with detailed model configuration."""
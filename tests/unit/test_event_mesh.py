@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from decimal import Decimal
+from typing import Any
 
 import pytest
 import pytest_asyncio
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from weaver_ai.events import AccessPolicy, EventMesh, EventMetadata
+from weaver_ai.events import AccessPolicy, Event, EventMesh, EventMetadata
 
 
 # Test event types
@@ -391,3 +393,25 @@ class TestEventMesh:
         await mesh.publish(DataEvent, DataEvent(message="after", value=1))
 
         assert len(received) == 1  # Only the one from during subscription
+
+
+class TestEventSerialization:
+    """Tests for Event JSON serialization."""
+
+    def test_json_matches_pydantic_encoding(self):
+        """Test that the fast encoder produces pydantic's wire format."""
+        event = Event(event_type="DataEvent", data=DataEvent(message="m", value=1))
+        expected = TypeAdapter(dict[str, Any]).dump_json(event.model_dump()).decode()
+
+        assert event.model_dump_json() == expected
+        assert Event.model_validate_json(event.model_dump_json()) == Event(
+            event_type="DataEvent",
+            data={"message": "m", "value": 1},
+            metadata=event.metadata,
+        )
+
+    def test_json_falls_back_for_types_orjson_rejects(self):
+        """Test that payloads such as Decimal still serialize."""
+        event = Event(event_type="Price", data={"amount": Decimal("1.50")})
+
+        assert '"amount":"1.50"' in event.model_dump_json()
@@ -59,6 +59,16 @@ class TestRedisEventMesh:
             assert mesh._connected is True
             mock_redis.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_disconnects(self, mesh, mock_redis):
+        """Test that close() releases the Redis connection."""
+        mesh.pubsub = AsyncMock()
+
+        await mesh.close()
+
+        mock_redis.aclose.assert_awaited_once()
+        assert mesh._connected is False
+
     @pytest.mark.asyncio
     async def test_publish_event(self, mesh, mock_redis):
         """Test publishing event to Redis."""
@@ -99,6 +109,44 @@ class TestRedisEventMesh:
         assert setex_args[0][0].startswith("event:")
         assert setex_args[0][1] == 300  # TTL
 
+    @pytest.mark.asyncio
+    async def test_publish_many_uses_one_pipeline(self, mesh, mock_redis):
+        """Test that a batch of events is sent in a single pipeline."""
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        mock_redis.pipeline = Mock(return_value=pipe)
+
+        event_ids = await mesh.publish_many(
+            [
+                ("test:channel", _TestData(message="a", value=1)),
+                ("test:other", {"value": 2}),
+            ]
+        )
+
+        assert len(event_ids) == 2
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args[0] for c in pipe.publish.call_args_list] == [
+            "test:channel",
+            "test:other",
+        ]
+        pipe.execute.assert_awaited_once()
+        mock_redis.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_to_stream_many_uses_one_pipeline(self, mesh, mock_redis):
+        """Test that stream entries are appended in a single pipeline."""
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=["1-0", "1-1"])
+        mock_redis.pipeline = Mock(return_value=pipe)
+
+        entry_ids = await mesh.add_to_stream_many(
+            "progress", [{"step": 1}, {"step": 2}], maxlen=100
+        )
+
+        assert entry_ids == ["1-0", "1-1"]
+        pipe.xadd.assert_any_call("progress", {"step": 2}, maxlen=100, approximate=True)
+        assert pipe.xadd.call_count == 2
+
     @pytest.mark.asyncio
     async def test_publish_task(self, mesh, mock_redis):
         """Test publishing task to queue."""
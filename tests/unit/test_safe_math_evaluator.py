@@ -0,0 +1,104 @@
+"""Unit tests for the safe math expression evaluator."""
+
+from __future__ import annotations
+
+import math
+from unittest.mock import patch
+
+import pytest
+
+from weaver_ai.tools.safe_math_evaluator import (
+    SafeMathEvaluator,
+    _parse_and_check,
+    create_safe_math_server,
+)
+
+
+class TestEvaluate:
+    """Tests for SafeMathEvaluator.evaluate."""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("2 + 3 * 4", 14),
+            ("-(2 ** 10)", -1024),
+            ("sqrt(16) + abs(-2)", 6.0),
+            ("max([1, 5, 3]) + min(2, 4)", 7),
+            ("round(pi, 2)", 3.14),
+            ("sin(0) + log(e)", 1.0),
+            (" 42 ", 42),
+            ("-3.5", -3.5),
+            ("1e3", 1000.0),
+        ],
+    )
+    def test_evaluates_supported_expressions(self, expression, expected):
+        """Test arithmetic, functions, lists and constants."""
+        assert SafeMathEvaluator().evaluate(expression) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("expression", "message"),
+        [
+            ("__import__('os')", "Forbidden keyword"),
+            ("EVAL(1)", "Forbidden keyword 'eval'"),
+            ("(2).real", "Attribute access"),
+            ("1 / 0", "Division by zero"),
+            ("2 ** 5000", "Exponent too large"),
+            ("x + 1", "Unknown variable"),
+            ("1 < 2", "Comparison"),
+            ("1 +", "Invalid syntax"),
+            ("", "Empty expression"),
+            ("007", "Invalid syntax"),
+            ("9" * 101, "Number too large"),
+        ],
+    )
+    def test_rejects_unsafe_or_invalid_expressions(self, expression, message):
+        """Test that unsafe and malformed expressions raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            SafeMathEvaluator().evaluate(expression)
+
+    @pytest.mark.parametrize(
+        "expression", ["10 ** 100 * 10", "1e100 * 10.0", "sum([10 ** 100, 10 ** 100])"]
+    )
+    def test_rejects_oversized_intermediate_results(self, expression):
+        """Test that int and float results share the same magnitude bound."""
+        with pytest.raises((OverflowError, ValueError), match="overflow|too large"):
+            SafeMathEvaluator().evaluate(expression)
+
+    def test_repeated_expressions_reuse_parsed_tree(self):
+        """Test that a repeated expression is parsed only once."""
+        _parse_and_check.cache_clear()
+
+        # Separate instances: the parse cache is shared module-wide
+        for _ in range(3):
+            assert SafeMathEvaluator().evaluate("tau / 2") == pytest.approx(math.pi)
+
+        info = _parse_and_check.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_results_are_reused_per_expression(self):
+        """Test that a repeated expression is not walked again."""
+        evaluator = SafeMathEvaluator()
+        assert evaluator.evaluate("sqrt(2) * sqrt(2)") == pytest.approx(2.0)
+
+        with patch.object(
+            SafeMathEvaluator, "_eval_node", side_effect=AssertionError
+        ) as walk:
+            assert evaluator.evaluate("sqrt(2) * sqrt(2)") == pytest.approx(2.0)
+        walk.assert_not_called()
+
+
+class TestSafeMathServer:
+    """Tests for create_safe_math_server."""
+
+    def test_servers_share_one_tool_handler(self):
+        """Test that servers reuse the module-level handler and report errors."""
+        first = create_safe_math_server("srv-1", "key")
+        second = create_safe_math_server("srv-2", "key")
+        handler = first.tools["safe_math_eval"]
+
+        assert handler is second.tools["safe_math_eval"]
+        assert handler({"expr": "2 * 21"}) == {"result": 42, "success": True}
+        assert handler({"expr": "1 / 0"}) == {
+            "error": "Division by zero",
+            "success": False,
+        }
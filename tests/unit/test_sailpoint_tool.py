@@ -0,0 +1,213 @@
+"""Unit tests for the SailPoint IIQ tool."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+
+from weaver_ai.tools import ToolRegistry
+from weaver_ai.tools.builtin.sailpoint import SailPointIIQTool
+
+
+class TestReadCache:
+    """Tests for the short-lived read cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_are_served_from_cache(self):
+        """Test that identical reads hit the MCP server only once."""
+        tool = SailPointIIQTool()
+        fetch = AsyncMock(return_value={"success": True, "data": {"users": []}})
+
+        with patch.object(tool, "_run_operation", fetch):
+            first = await tool._dispatch("list_users", {"limit": 5, "offset": 0})
+            second = await tool._dispatch("list_users", {"offset": 0, "limit": 5})
+
+        assert first == second
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_and_invalidate_bypass_cache(self):
+        """Test that errors are not cached and invalidate() forces a refetch."""
+        tool = SailPointIIQTool()
+        fetch = AsyncMock(
+            side_effect=[
+                {"success": False, "error": "boom"},
+                {"success": True, "data": {"id": "alice"}},
+                {"success": True, "data": {"id": "alice"}},
+            ]
+        )
+
+        with patch.object(tool, "_run_operation", fetch):
+            query = {"user_id": "alice"}
+            assert (await tool._dispatch("get_user", query))["success"] is False
+            assert (await tool._dispatch("get_user", query))["success"] is True
+            await tool._dispatch("get_user", query)
+            assert fetch.await_count == 2
+
+            tool.invalidate("get_user")
+            await tool._dispatch("get_user", query)
+            assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_mock_fallbacks_are_not_cached(self):
+        """Test that reads refetch once an unreachable server comes back."""
+        tool = SailPointIIQTool()
+        response = MagicMock(status_code=200)
+        response.content = orjson.dumps(
+            {"jsonrpc": "2.0", "result": {"users": [], "total": 0}, "id": "x"}
+        )
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=[httpx.ConnectError("refused"), response])
+
+        with patch.object(SailPointIIQTool, "_get_client", return_value=client):
+            query = {"limit": 5, "offset": 0}
+            down = await tool._dispatch("list_users", query)
+            up = await tool._dispatch("list_users", query)
+
+        assert down["fallback"] is True and down["data"]["_mock"] is True
+        assert up["data"] == {"users": [], "total": 0}
+        assert client.post.await_count == 2
+
+
+class TestClientLifecycle:
+    """Tests for the shared MCP HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_unregister_closes_only_that_tools_client(self):
+        """Test that unregistering a tool leaves other instances' clients open."""
+        registry = ToolRegistry()
+        tool = SailPointIIQTool()
+        other = SailPointIIQTool()
+        await registry.register_tool(tool)
+
+        client = tool._get_client()
+        other_client = other._get_client()
+        assert tool._get_client() is client
+
+        await registry.unregister_tool(tool.name)
+
+        assert client.is_closed
+        assert tool._client is None
+        assert not other_client.is_closed
+        await other.aclose()
+
+
+class TestBatchedCalls:
+    """Tests for JSON-RPC batch requests to the MCP server."""
+
+    @pytest.mark.asyncio
+    async def test_batch_demultiplexes_responses_by_id(self):
+        """Test that batched responses are matched to requests by id."""
+        tool = SailPointIIQTool()
+        sent: list = []
+
+        async def post(url, content):
+            requests = orjson.loads(content)
+            sent.append(requests)
+            response = MagicMock()
+            response.status_code = 200
+            response.content = orjson.dumps(
+                [
+                    {"jsonrpc": "2.0", "result": {"n": i}, "id": r["id"]}
+                    for i, r in reversed(list(enumerate(requests)))
+                ]
+            )
+            return response
+
+        client = MagicMock()
+        client.post = post
+
+        with patch.object(SailPointIIQTool, "_get_client", return_value=client):
+            result = await tool._batch_operations(
+                ["count_users_roles", "list_roles", "get_user"], {"limit": 5}
+            )
+
+        assert len(sent) == 1 and len(sent[0]) == 2
+        count, roles, user = result["data"]["results"]
+        assert count == {
+            "operation": "count_users_roles",
+            "success": True,
+            "data": {"n": 0},
+        }
+        assert roles["data"] == {"n": 1}
+        assert user["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_count_and_list_falls_back_to_mock_data(self):
+        """Test that an unreachable server yields mock data for every part."""
+        tool = SailPointIIQTool()
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        with patch.object(SailPointIIQTool, "_get_client", return_value=client):
+            result = await tool.count_and_list(limit=3)
+
+        assert result["success"] is True
+        assert len(result["data"]["users"]["users"]) == 3
+        assert len(result["data"]["roles"]["roles"]) == 3
+        assert result["data"]["counts"]["users"]["total"] == 1250
+
+
+class TestPinnedRoles:
+    """Tests for the pinned full role listing."""
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_role_pages_share_one_fetch(self):
+        """Test that role pages are sliced from one pinned upstream listing."""
+        tool = SailPointIIQTool()
+        roles = [{"id": f"role_{i}"} for i in range(12)]
+        fetch = AsyncMock(
+            return_value={
+                "success": True,
+                "data": {"roles": roles, "total": len(roles)},
+            }
+        )
+
+        with patch.object(tool, "_mcp_call", fetch):
+            first = await tool._list_roles({"limit": 5, "offset": 0})
+            second = await tool._list_roles({"limit": 5, "offset": 10})
+            assert fetch.await_count == 1
+
+            tool.invalidate_pinned("roles_all")
+            await tool._list_roles({"limit": 5, "offset": 0})
+            assert fetch.await_count == 2
+
+        assert first["data"]["roles"] == roles[:5]
+        assert second["data"]["roles"] == roles[10:]
+        assert second["data"]["offset"] == 10
+
+    @pytest.mark.asyncio
+    async def test_catalogues_too_large_to_pin_are_paged_directly(self):
+        """Test that a failed pin is remembered instead of retried per call."""
+        tool = SailPointIIQTool()
+        prefix = [{"id": f"role_{i}"} for i in range(1000)]
+
+        async def mcp_call(tool_name, arguments, id_prefix, mock_fn):
+            if arguments["limit"] == 1000:
+                return {"success": True, "data": {"roles": prefix, "total": 5000}}
+            return {"success": True, "data": {"roles": ["page"], "total": 5000}}
+
+        fetch = AsyncMock(side_effect=mcp_call)
+
+        with patch.object(tool, "_mcp_call", fetch):
+            # The page falls inside the fetched prefix, so it is sliced
+            first = await tool._list_roles({"limit": 5, "offset": 10})
+            second = await tool._list_roles({"limit": 5, "offset": 4000})
+            await tool._list_roles({"limit": 5, "offset": 0})
+
+            assert [c.args[1]["limit"] for c in fetch.await_args_list] == [
+                1000,
+                5,
+                5,
+            ]
+
+            # Once the flag expires, pinning is tried again
+            tool._unpinnable_until["roles_all"] = 0.0
+            await tool._list_roles({"limit": 5, "offset": 0})
+            assert fetch.await_args_list[-1].args[1]["limit"] == 1000
+
+        assert first["data"]["roles"] == prefix[10:15]
+        assert second["data"]["roles"] == ["page"]
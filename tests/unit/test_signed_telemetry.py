@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 
+import jwt
 import pytest
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
 
 from weaver_ai.security.audit import log_security_audit
 from weaver_ai.settings import AppSettings
@@ -90,6 +91,50 @@ class TestEventSigning:
         assert signed_event.signature
         assert signed_event.event_hash
 
+    def test_sign_event_produces_standard_jwt(self, rsa_keypair):
+        """Signature should be a standard RS256 JWT decodable by PyJWT."""
+        private_key, public_key = rsa_keypair
+        event_data = {"user_id": "test@example.com", "reason": "invalid_token"}
+
+        signed_event = _sign_event("auth_failure", event_data, private_key)
+
+        assert jwt.get_unverified_header(signed_event.signature) == {
+            "alg": "RS256",
+            "typ": "JWT",
+        }
+        decoded = jwt.decode(signed_event.signature, public_key, algorithms=["RS256"])
+        assert decoded == {
+            "timestamp": signed_event.timestamp,
+            "event_type": "auth_failure",
+            "event_hash": signed_event.event_hash,
+        }
+
+    def test_sign_event_escapes_event_type(self, rsa_keypair):
+        """Event types needing JSON escaping should round-trip through the JWT."""
+        private_key, public_key = rsa_keypair
+        event_type = 'policy "violation" \\ é'
+
+        signed_event = _sign_event(event_type, {"user_id": "test"}, private_key)
+
+        decoded = jwt.decode(signed_event.signature, public_key, algorithms=["RS256"])
+        assert decoded["event_type"] == event_type
+        assert verify_event_signature(signed_event, public_key) is True
+
+    def test_sign_event_rejects_non_rsa_key(self):
+        """Non-RSA signing keys should be rejected with a clear error."""
+        ec_pem = (
+            ec.generate_private_key(ec.SECP256R1())
+            .private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+            .decode()
+        )
+
+        with pytest.raises(ValueError, match="RSA private key"):
+            _sign_event("auth_failure", {"user_id": "test"}, ec_pem)
+
     def test_verify_event_signature_valid(self, rsa_keypair):
         """Valid signature should verify successfully."""
         private_key, public_key = rsa_keypair
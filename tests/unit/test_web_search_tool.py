@@ -0,0 +1,154 @@
+"""Unit tests for the web search tool."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from weaver_ai.tools import ToolExecutionContext
+from weaver_ai.tools.builtin.web_search import (
+    WebSearchTool,
+    _iter_json_objects,
+    _JSONObjectStream,
+)
+
+
+class TestResultExtraction:
+    """Tests for pulling JSON results out of model output text."""
+
+    def test_extracts_nested_objects_in_any_key_order(self):
+        """Test that nested and reordered result objects are both found."""
+        text = (
+            'Results: {"title": "A", "url": "https://a", "snippet": "s",'
+            ' "meta": {"rank": 1}} and {"snippet": "t", "url": "https://b",'
+            ' "title": "B"}'
+        )
+
+        results = list(_iter_json_objects(text))
+
+        assert [r["title"] for r in results] == ["A", "B"]
+        assert results[0]["meta"] == {"rank": 1}
+
+    def test_finds_results_nested_in_a_wrapper(self):
+        """Test that results wrapped in another object or list are found."""
+        text = (
+            'Here: {"results": [{"title": "A", "url": "u", "snippet": "s"},'
+            ' {"title": "B", "url": "v", "snippet": "t"}], "count": 2}'
+        )
+
+        assert [r["title"] for r in _iter_json_objects(text)] == ["A", "B"]
+
+    def test_skips_malformed_and_incomplete_objects(self):
+        """Test that broken JSON and objects missing keys are ignored."""
+        text = '{broken {"title": "only"} {"title": "C", "url": "u", "snippet": "s"}'
+
+        assert list(_iter_json_objects(text)) == [
+            {"title": "C", "url": "u", "snippet": "s"}
+        ]
+
+
+class TestStreamedExtraction:
+    """Tests for extracting results from streamed text."""
+
+    def test_objects_are_emitted_once_complete(self):
+        """Test that an object split across chunks is emitted on completion."""
+        parser = _JSONObjectStream()
+
+        assert parser.feed('1. {"title": "A", "url": "u", ') == []
+        assert parser.feed('"snippet": "s"} 2. {"title": "B"') == [
+            {"title": "A", "url": "u", "snippet": "s"}
+        ]
+        assert parser.feed(', "url": "v", "snippet": "t"}') == [
+            {"title": "B", "url": "v", "snippet": "t"}
+        ]
+
+    def test_stray_braces_do_not_stall_the_stream(self):
+        """Test that a "{" in prose is skipped instead of blocking results."""
+        parser = _JSONObjectStream()
+
+        assert parser.feed('Sure {here} are: {"title": "C", "url": "u", ') == []
+        assert parser.feed('"snippet": "s"} and {oops') == [
+            {"title": "C", "url": "u", "snippet": "s"}
+        ]
+        # Only the possibly incomplete tail is kept for the next chunk
+        assert parser._buffer == "{oops"
+
+    def test_waits_for_values_cut_off_mid_token(self):
+        """Test that a literal or string split across chunks is retried."""
+        parser = _JSONObjectStream()
+
+        assert parser.feed('{"title": "A", "url": "u", "top": tr') == []
+        assert parser.feed('ue, "snippet": "long sni') == []
+        assert parser.feed('ppet"}') == [
+            {"title": "A", "url": "u", "top": True, "snippet": "long snippet"}
+        ]
+
+    def test_wrapped_results_are_emitted_when_the_wrapper_closes(self):
+        """Test that streamed results nested in a wrapper are found."""
+        parser = _JSONObjectStream()
+
+        assert (
+            parser.feed('{"results": [{"title": "A", "url": "u", "snippet": "s"}') == []
+        )
+        assert parser.feed("]}") == [{"title": "A", "url": "u", "snippet": "s"}]
+
+    def test_close_skips_unfinished_text(self):
+        """Test that close() drops an object the stream never finished."""
+        parser = _JSONObjectStream()
+
+        assert parser.feed(
+            '{"title": "C", "url": "u", "snippet": "s"} {"title": "D"'
+        ) == [{"title": "C", "url": "u", "snippet": "s"}]
+        assert parser.close() == []
+        assert parser._buffer == ""
+
+
+def _streaming_client(chunks: list[str]) -> MagicMock:
+    """Build a mock AsyncAnthropic client whose replies stream the chunks."""
+    received: list[str] = []
+
+    async def text_stream():
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    @asynccontextmanager
+    async def stream(**kwargs):
+        yield MagicMock(text_stream=text_stream())
+
+    client = MagicMock()
+    client.messages.stream = MagicMock(side_effect=stream)
+    client.close = AsyncMock()
+    client.received = received
+    return client
+
+
+class TestAnthropicClient:
+    """Tests for the shared async Anthropic client."""
+
+    @pytest.mark.asyncio
+    async def test_searches_stream_through_one_shared_client(self, monkeypatch):
+        """Test that searches reuse one client and stop streaming early."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = _streaming_client(
+            [
+                '{"title": "A", "url": "https://a", "snippet": "s"}',
+                '{"title": "B", "url": "https://b", "snippet": "t"}',
+                "never read",
+            ]
+        )
+        context = ToolExecutionContext(agent_id="agent", user_id="user")
+        tool = WebSearchTool()
+
+        with patch("anthropic.AsyncAnthropic", return_value=client) as factory:
+            result = await tool.execute({"query": "weaver", "max_results": 2}, context)
+            assert "never read" not in client.received
+            await tool.execute({"query": "weaver"}, context)
+            await tool.aclose()
+
+        assert [r["title"] for r in result.data["results"]] == ["A", "B"]
+        factory.assert_called_once_with(api_key="test-key")
+        assert client.messages.stream.call_count == 2
+        client.close.assert_awaited_once()
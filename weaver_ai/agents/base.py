@@ -429,7 +429,7 @@ class BaseAgent(BaseModel):
                 )
             )
 
-        return result.model_dump()
+        return result.to_dict()
 
     async def can_process(self, event: Event) -> bool:
         """Check if agent can handle this event.
@@ -7,7 +7,7 @@ import random
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +18,11 @@ class ErrorStrategy(BaseModel, ABC):
     class Config:
         arbitrary_types_allowed = True
 
+    # True if execute() only awaits func, so callers may call func directly.
+    # Subclasses that override execute() of a passthrough strategy must
+    # reset this.
+    is_passthrough: ClassVar[bool] = False
+
     @abstractmethod
     async def execute(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with error handling.
@@ -44,6 +49,8 @@ class ErrorStrategy(BaseModel, ABC):
 class FailFast(ErrorStrategy):
     """Fail immediately on any error."""
 
+    is_passthrough: ClassVar[bool] = True
+
     async def execute(self, func: Callable, *args, **kwargs) -> Any:
         """Execute with no error handling - fail fast.
 
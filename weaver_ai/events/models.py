@@ -12,7 +12,11 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
+
+# Fallback encoder for payload types orjson does not handle (sets, Decimal)
+_DICT_ADAPTER = TypeAdapter(dict[str, Any])
 
 
 class AccessPolicy(BaseModel):
@@ -108,6 +112,8 @@ class Event(BaseModel):
         """Override to ensure data is always serialized as dict."""
         # First convert to dict, then to JSON
         data_dict = self.model_dump(**kwargs)
-        from pydantic import TypeAdapter
-
-        return TypeAdapter(dict[str, Any]).dump_json(data_dict).decode()
+        try:
+            # UTC datetimes end in "Z", matching pydantic's own output
+            return orjson.dumps(data_dict, option=orjson.OPT_UTC_Z).decode()
+        except TypeError:
+            return _DICT_ADAPTER.dump_json(data_dict).decode()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import operator as op
 import re
+from collections.abc import Callable
 from typing import Any, ClassVar
 
 from pydantic import BaseModel
@@ -22,6 +23,53 @@ class Tool(BaseModel):
         raise NotImplementedError
 
 
+# Numeric literals as they can appear in a PythonEvalTool expression
+_NUMBER_RE = re.compile(r"\d+\.\d*|\.\d+|\d+")
+# Ints with a leading zero ("07") are a SyntaxError and must take the slow path
+_BAD_INT_RE = re.compile(r"0\d+")
+
+
+def _safe_div(left: Any, right: Any) -> Any:
+    if right == 0:
+        raise ValueError("Division by zero")
+    return left / right
+
+
+def _safe_pow(left: Any, right: Any) -> Any:
+    if abs(right) > 100:
+        raise ValueError("Exponent too large")
+    return left**right
+
+
+class _TemplateCompiler(ast.NodeTransformer):
+    """Rewrite a validated expression into a lambda over its numeric literals.
+
+    Literals become parameters ``p0..pN`` in source order; ``/`` and ``**``
+    are routed through the same guards the tree-walking evaluator applies.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        name = ast.Name(id=f"p{self.count}", ctx=ast.Load())
+        self.count += 1
+        return name
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        # Visit left before right so parameter order matches source order
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        guard = {ast.Div: "_div", ast.Pow: "_pow"}.get(type(node.op))
+        if guard is None:
+            return node
+        return ast.Call(
+            func=ast.Name(id=guard, ctx=ast.Load()),
+            args=[node.left, node.right],
+            keywords=[],
+        )
+
+
 class PythonEvalTool(Tool):
     name: str = "python_eval"
     description: str = "Evaluate simple arithmetic expressions"
@@ -42,6 +90,9 @@ class PythonEvalTool(Tool):
     MAX_RESULT: ClassVar[int] = 10**10
     # Valid characters in expression
     VALID_CHARS_PATTERN: ClassVar[str] = r"^[\d\s\+\-\*\/\%\(\)\.]+$"
+    # Compiled evaluators keyed by expression with numeric literals masked out
+    MAX_TEMPLATES: ClassVar[int] = 256
+    _template_cache: ClassVar[dict[str, Callable[..., Any]]] = {}
 
     def call(self, expr: str) -> dict:
         # Input validation
@@ -59,9 +110,23 @@ class PythonEvalTool(Tool):
         if any(danger in expr.lower() for danger in ["import", "exec", "eval", "__"]):
             raise ValueError("Potentially dangerous expression")
 
+        # Expressions differing only in their numbers share a compiled template
+        template = _NUMBER_RE.sub("#", expr)
+        literals = _NUMBER_RE.findall(expr)
+
         try:
-            node = ast.parse(expr, mode="eval")
-            result = self._eval(node.body)
+            compiled = self._template_cache.get(template)
+            if compiled is not None and not any(
+                _BAD_INT_RE.fullmatch(lit) for lit in literals
+            ):
+                result = compiled(
+                    *(float(lit) if "." in lit else int(lit) for lit in literals)
+                )
+            else:
+                node = ast.parse(expr, mode="eval")
+                result = self._eval(node.body)
+                # _eval succeeded, so the tree only holds supported nodes
+                self._store_template(template, node)
 
             # Validate result size
             if abs(result) > self.MAX_RESULT:
@@ -71,6 +136,30 @@ class PythonEvalTool(Tool):
         except (SyntaxError, TypeError) as e:
             raise ValueError(f"Invalid expression: {e}") from e
 
+    def _store_template(self, template: str, tree: ast.Expression) -> None:
+        compiler = _TemplateCompiler()
+        body = compiler.visit(tree.body)
+        params = [ast.arg(arg=f"p{i}") for i in range(compiler.count)]
+        lam = ast.Expression(
+            body=ast.Lambda(
+                args=ast.arguments(
+                    posonlyargs=[],
+                    args=params,
+                    kwonlyargs=[],
+                    kw_defaults=[],
+                    defaults=[],
+                ),
+                body=body,
+            )
+        )
+        code = compile(ast.fix_missing_locations(lam), "<python_eval>", "eval")
+        namespace = {"__builtins__": {}, "_div": _safe_div, "_pow": _safe_pow}
+
+        if len(self._template_cache) >= self.MAX_TEMPLATES:
+            # Evict the oldest template (dicts keep insertion order)
+            self._template_cache.pop(next(iter(self._template_cache)))
+        self._template_cache[template] = eval(code, namespace)  # noqa: S307
+
     def _eval(self, node: ast.AST) -> Any:
         if isinstance(node, ast.BinOp):
             left = self._eval(node.left)
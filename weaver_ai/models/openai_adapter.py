@@ -8,13 +8,13 @@ from .base import ModelResponse
 class OpenAIAdapter:
     """OpenAI API adapter.
 
-    Note: Requires OPENAI_API_KEY environment variable.
-    If not available, will raise an error.
+    Note: Requires an API key, passed in or via the OPENAI_API_KEY
+    environment variable. If not available, will raise an error.
     """
 
-    def __init__(self, model: str = "gpt-3.5-turbo"):
+    def __init__(self, model: str = "gpt-3.5-turbo", api_key: str | None = None):
         self.model = model
-        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
 
     async def generate(self, prompt: str, **kwargs) -> ModelResponse:
         """Generate response using OpenAI API."""
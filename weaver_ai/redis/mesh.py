@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 from uuid import uuid4
 
@@ -58,6 +58,10 @@ class RedisEventMesh:
 
             self._connected = False
 
+    async def close(self):
+        """Disconnect from Redis (alias of disconnect)."""
+        await self.disconnect()
+
     async def publish(
         self,
         channel: str | None,
@@ -112,6 +116,61 @@ class RedisEventMesh:
 
         return event.metadata.event_id
 
+    async def publish_many(
+        self, events: Sequence[tuple[str, BaseModel | dict[str, Any]]]
+    ) -> list[str]:
+        """Publish several events in one pipelined round trip.
+
+        Args:
+            events: (channel, data) pairs, published in order
+
+        Returns:
+            Event IDs, in the same order as the events
+        """
+        if not self._connected:
+            await self.connect()
+
+        event_ids = []
+        pipe = self.redis.pipeline(transaction=False)
+        for channel, data in events:
+            event = Event(
+                event_type=data.__class__.__name__,
+                data=data.model_dump() if isinstance(data, BaseModel) else data,
+                metadata=EventMetadata(),
+            )
+            pipe.publish(channel, event.model_dump_json())
+            event_ids.append(event.metadata.event_id)
+
+        await pipe.execute()
+        return event_ids
+
+    async def add_to_stream_many(
+        self,
+        stream: str,
+        entries: Sequence[dict[str, str | int | float]],
+        maxlen: int | None = None,
+    ) -> list[str]:
+        """Append flat entries to a Redis stream in one pipelined round trip.
+
+        Unlike pub/sub, stream entries persist, so late consumers can read
+        them in batches with XREAD COUNT.
+
+        Args:
+            stream: Stream key
+            entries: Field mappings to append, in order
+            maxlen: Approximate cap on the stream length, if any
+
+        Returns:
+            Stream entry IDs, in the same order as the entries
+        """
+        if not self._connected:
+            await self.connect()
+
+        pipe = self.redis.pipeline(transaction=False)
+        for fields in entries:
+            pipe.xadd(stream, fields, maxlen=maxlen, approximate=True)
+        return await pipe.execute()
+
     async def subscribe(
         self,
         patterns: list[str],
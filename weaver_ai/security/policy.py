@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +10,9 @@ import yaml
 from fastapi import HTTPException
 from pydantic import BaseModel
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class GuardrailDecision(BaseModel):
     text: str
@@ -25,8 +29,17 @@ def load_policies(path: Path) -> dict[str, Any]:
     except (RuntimeError, ValueError) as e:
         raise ValueError(f"Invalid policy file path: {e}") from e
 
+    return _load_policy_file(resolved_path, resolved_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_policy_file(path: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a policy file, cached until its modification time changes.
+
+    Callers must treat the returned dict as read-only, since it is shared.
+    """
     with path.open() as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_SafeLoader) or {}
 
 
 def normalize_text(text: str) -> str:
@@ -9,9 +9,31 @@ from fastapi import HTTPException
 from .auth import UserContext
 
 
+def load_roles(path: Path) -> dict[str, list[str]]:
+    """Load roles, re-parsing the file only when its modification time changes.
+
+    Returns empty roles if the file is missing or invalid (deny by default).
+    """
+    try:
+        mtime_ns: int | None = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    try:
+        return _load_roles(path, mtime_ns)
+    except (ValueError, FileNotFoundError, OSError):
+        # If role file doesn't exist or can't be loaded, use empty roles
+        # This allows the system to work without a roles file (deny by default)
+        return {}
+
+
 @lru_cache(maxsize=100)  # Limit cache size to prevent memory exhaustion
-def _load_roles(path: Path) -> dict[str, list[str]]:
-    """Load roles from YAML file with security validation."""
+def _load_roles(path: Path, mtime_ns: int | None = None) -> dict[str, list[str]]:
+    """Load roles from YAML file with security validation.
+
+    ``mtime_ns`` only takes part in the cache key, so an edited file is
+    picked up on the next lookup.
+    """
     # Validate path to prevent directory traversal
     try:
         resolved_path = path.resolve()
@@ -77,8 +99,18 @@ def _load_roles(path: Path) -> dict[str, list[str]]:
     return roles
 
 
-def check_access(user: UserContext, scope: str, *, roles_path: Path) -> None:
-    """Check if user has required scope through direct assignment or roles."""
+def check_access(
+    user: UserContext,
+    scope: str,
+    *,
+    roles_path: Path | None = None,
+    roles: dict[str, list[str]] | None = None,
+) -> None:
+    """Check if user has required scope through direct assignment or roles.
+
+    Pass preloaded ``roles`` to check several scopes against one load of
+    the role file; otherwise they are loaded from ``roles_path``.
+    """
     if not user:
         raise HTTPException(status_code=401, detail="No user context")
 
@@ -89,12 +121,8 @@ def check_access(user: UserContext, scope: str, *, roles_path: Path) -> None:
     if ":" not in scope:
         raise ValueError(f"Invalid scope format: {scope}")
 
-    try:
-        roles = _load_roles(roles_path)
-    except (ValueError, FileNotFoundError, OSError):
-        # If role file doesn't exist or can't be loaded, use empty roles
-        # This allows the system to work without a roles file (deny by default)
-        roles = {}
+    if roles is None:
+        roles = load_roles(roles_path) if roles_path is not None else {}
 
     # Collect all user scopes
     user_scopes = set(user.scopes)
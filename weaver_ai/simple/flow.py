@@ -125,7 +125,7 @@ class Flow:
 
                     # Add explicit route for sequential chaining
                     self._workflow.add_route(
-                        when=lambda result, idx=i: True,  # Always route in sequence
+                        when=None,  # Always route in sequence
                         from_agent=current._agent_name,
                         to_agent=next_agent._agent_name,
                         priority=100 - i,  # Higher priority for earlier routes
@@ -160,7 +160,7 @@ class Flow:
             # Create a virtual "splitter" that sends to all agents
             for agent in agents:
                 self._workflow.add_route(
-                    when=lambda result: True,  # Always route
+                    when=None,  # Always route
                     from_agent="__input__",  # Special marker for input
                     to_agent=agent._agent_name,
                     priority=50,  # Same priority for parallel
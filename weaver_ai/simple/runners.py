@@ -8,18 +8,32 @@ serving them as HTTP APIs without dealing with the underlying complexity.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 from .flow import Flow
 
+# Request/response models are validated on every call: build their schemas
+# eagerly at import and keep per-validation work to the minimum
+_WIRE_MODEL_CONFIG = ConfigDict(
+    defer_build=False,
+    extra="ignore",
+    str_strip_whitespace=False,
+    validate_assignment=False,
+    revalidate_instances="never",
+)
+
 
 class SimpleRequest(BaseModel):
     """Simple request model for flow execution."""
 
+    model_config = _WIRE_MODEL_CONFIG
+
     input: Any
     config: dict[str, Any] = {}
 
@@ -27,11 +41,34 @@ class SimpleRequest(BaseModel):
 class SimpleResponse(BaseModel):
     """Simple response model for flow execution."""
 
+    model_config = _WIRE_MODEL_CONFIG
+
     output: Any
     success: bool = True
     error: str | None = None
 
 
+def _build_metadata(agent_or_flow: Callable | Flow) -> dict[str, Any]:
+    """Describe an agent or flow for the /metadata endpoint."""
+    if isinstance(agent_or_flow, Flow):
+        return {
+            "type": "flow",
+            "name": agent_or_flow.name,
+            "agents": [a.__name__ for a in agent_or_flow._agents],
+        }
+    elif hasattr(agent_or_flow, "_agent_config"):
+        config = agent_or_flow._agent_config
+        return {
+            "type": "agent",
+            "name": agent_or_flow.__name__,
+            "model": config.get("model"),
+            "cache": config.get("cache"),
+            "retry": config.get("retry"),
+        }
+    else:
+        return {"type": "unknown"}
+
+
 async def run(agent_or_flow: Callable | Flow, input_data: Any, **kwargs) -> Any:
     """
     Run an agent or flow with the given input.
@@ -96,7 +133,10 @@ def serve(
         host: The host to bind to
         title: API title for documentation
         description: API description for documentation
-        **kwargs: Additional FastAPI configuration
+        **kwargs: Additional FastAPI configuration. Pass ``start=False`` to
+            skip starting uvicorn and only build the app, e.g. for mounting
+            under gunicorn (``uvicorn.workers.UvicornWorker``) or hypercorn.
+            ``access_log=True`` re-enables uvicorn's per-request access log.
 
     Returns:
         The FastAPI application instance
@@ -114,8 +154,16 @@ def serve(
         flow = Flow().chain(agent1, agent2)
         serve(flow, port=8000)
     """
+    start = kwargs.pop("start", True)
+    access_log = kwargs.pop("access_log", False)
+
     # Create FastAPI app
-    app = FastAPI(title=title, description=description, **kwargs)
+    app = FastAPI(
+        title=title,
+        description=description,
+        default_response_class=ORJSONResponse,
+        **kwargs,
+    )
 
     # Add health check
     @app.get("/health")
@@ -123,14 +171,18 @@ def serve(
         return {"status": "healthy", "service": "weaver-ai-simple"}
 
     # Add main processing endpoint
-    @app.post("/process", response_model=SimpleResponse)
+    # No response_model: the SimpleResponse is already validated, so dump it
+    # straight to orjson instead of having FastAPI validate it a second time.
+    # mode="json" still converts Decimals, sets and non-str keys.
+    @app.post("/process")
     async def process(request: SimpleRequest):
         """Process input through the agent or flow."""
         try:
             result = await run(agent_or_flow, request.input)
-            return SimpleResponse(output=result, success=True)
+            resp = SimpleResponse(output=result, success=True)
         except Exception as e:
-            return SimpleResponse(output=None, success=False, error=str(e))
+            resp = SimpleResponse(output=None, success=False, error=str(e))
+        return ORJSONResponse(resp.model_dump(mode="json"))
 
     # Add GET endpoint for simple queries
     @app.get("/process")
@@ -146,47 +198,53 @@ def serve(
     @app.post("/batch", response_model=list[SimpleResponse])
     async def batch_process(requests: list[SimpleRequest]):
         """Process multiple inputs in parallel."""
-        tasks = [run(agent_or_flow, req.input) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        responses = []
-        for result in results:
-            if isinstance(result, Exception):
-                responses.append(
-                    SimpleResponse(output=None, success=False, error=str(result))
-                )
-            else:
-                responses.append(SimpleResponse(output=result, success=True))
 
-        return responses
+        async def _one(req: SimpleRequest) -> tuple[bool, Any]:
+            # Convert failures to (ok, value) pairs here so the response
+            # loop below needs no per-item isinstance check
+            try:
+                return True, await run(agent_or_flow, req.input)
+            except Exception as e:
+                return False, str(e)
+
+        # _one never raises, so the TaskGroup only cancels siblings on
+        # cancellation of the request itself
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_one(req)) for req in requests]
+        results = [t.result() for t in tasks]
+
+        return [
+            (
+                SimpleResponse(output=out, success=True)
+                if ok
+                else SimpleResponse(output=None, success=False, error=out)
+            )
+            for ok, out in results
+        ]
+
+    # Metadata is fixed once the app is built, so encode it a single time
+    metadata_body = orjson.dumps(_build_metadata(agent_or_flow))
 
     # Add metadata endpoint
     @app.get("/metadata")
     async def metadata():
         """Get metadata about the agent or flow."""
-        if isinstance(agent_or_flow, Flow):
-            return {
-                "type": "flow",
-                "name": agent_or_flow.name,
-                "agents": [a.__name__ for a in agent_or_flow._agents],
-            }
-        elif hasattr(agent_or_flow, "_agent_config"):
-            config = agent_or_flow._agent_config
-            return {
-                "type": "agent",
-                "name": agent_or_flow.__name__,
-                "model": config.get("model"),
-                "cache": config.get("cache"),
-                "retry": config.get("retry"),
-            }
-        else:
-            return {"type": "unknown"}
+        return Response(content=metadata_body, media_type="application/json")
 
     # Start the server if running as main
-    if kwargs.get("start", True):
+    if start:
         import uvicorn
 
-        uvicorn.run(app, host=host, port=port)
+        # "auto" selects uvloop and httptools when installed (uvicorn[standard])
+        config = uvicorn.Config(
+            app,
+            host=host,
+            port=port,
+            loop="auto",
+            http="auto",
+            access_log=access_log,
+        )
+        uvicorn.Server(config).run()
 
     return app
 
@@ -231,6 +289,10 @@ class SimpleOrchestrator:
         """
         self.redis_url = redis_url
         self.flows: dict[str, Flow] = {}
+        # Per-flow dispatch and /flows entries, precomputed in register()
+        self._run_map: dict[str, Callable[[Any], Awaitable[Any]]] = {}
+        self._flow_meta: dict[str, dict[str, Any]] = {}
+        self._flows_body: bytes | None = None
 
     def register(self, name: str, flow: Flow) -> None:
         """
@@ -241,6 +303,12 @@ class SimpleOrchestrator:
             flow: The Flow instance to register
         """
         self.flows[name] = flow
+        self._run_map[name] = flow.run
+        self._flow_meta[name] = {
+            "name": name,
+            "agents": [a.__name__ for a in flow._agents],
+        }
+        self._flows_body = None
 
     async def run(self, flow_name: str, input_data: Any) -> Any:
         """
@@ -253,10 +321,11 @@ class SimpleOrchestrator:
         Returns:
             The output from the flow
         """
-        if flow_name not in self.flows:
+        flow_run = self._run_map.get(flow_name)
+        if flow_run is None:
             raise ValueError(f"Flow '{flow_name}' not found")
 
-        return await self.flows[flow_name].run(input_data)
+        return await flow_run(input_data)
 
     def serve_all(self, port: int = 8000, host: str = "0.0.0.0") -> FastAPI:
         """
@@ -272,6 +341,7 @@ class SimpleOrchestrator:
         app = FastAPI(
             title="Weaver AI Multi-Flow API",
             description="API serving multiple Weaver AI flows",
+            default_response_class=ORJSONResponse,
         )
 
         @app.get("/health")
@@ -281,12 +351,11 @@ class SimpleOrchestrator:
         @app.get("/flows")
         async def list_flows():
             """List all available flows."""
-            return {
-                "flows": [
-                    {"name": name, "agents": [a.__name__ for a in flow._agents]}
-                    for name, flow in self.flows.items()
-                ]
-            }
+            if self._flows_body is None:
+                self._flows_body = orjson.dumps(
+                    {"flows": list(self._flow_meta.values())}
+                )
+            return Response(content=self._flows_body, media_type="application/json")
 
         @app.post("/run/{flow_name}")
         async def run_flow(flow_name: str, request: SimpleRequest):
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import logging
-from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import jwt
+import orjson
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 try:
     import logfire
@@ -25,6 +29,18 @@ from pydantic import BaseModel
 logger = logging.getLogger(__name__)
 
 
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as required by JWS (RFC 7515)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# Shared no-op span; nullcontext is reusable and avoids a generator per call
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+# The JWS header is invariant for signed events, so encode it once
+_JWS_HEADER_B64 = _b64url(b'{"alg":"RS256","typ":"JWT"}')
+
+
 class TelemetryConfig(BaseModel):
     """Configuration for telemetry."""
 
@@ -123,24 +139,20 @@ def instrument_all() -> None:
         logger.error(f"Failed to auto-instrument with Logfire: {e}")
 
 
-@contextmanager
-def start_span(name: str, **attrs: Any) -> Iterator[None]:
+def start_span(name: str, **attrs: Any) -> AbstractContextManager[Any]:
     """Create a telemetry span for tracing operations.
 
     Args:
         name: Span name
         **attrs: Additional span attributes
 
-    Yields:
-        None
+    Returns:
+        Context manager for the span (a shared no-op if Logfire is unavailable)
     """
     if not LOGFIRE_AVAILABLE or logfire is None:
-        # Fallback to no-op if Logfire not available
-        yield
-        return
+        return _NULL_SPAN
 
-    with logfire.span(name, **attrs):
-        yield
+    return logfire.span(name, **attrs)
 
 
 def log_info(message: str, **attrs: Any) -> None:
@@ -152,8 +164,9 @@ def log_info(message: str, **attrs: Any) -> None:
     """
     if LOGFIRE_AVAILABLE and logfire is not None:
         logfire.info(message, **attrs)
-    else:
-        logger.info(f"{message} {attrs}")
+    elif logger.isEnabledFor(logging.INFO):
+        # Lazy %-formatting: attrs are only rendered if a handler emits the record
+        logger.info("%s %s", message, attrs)
 
 
 def log_error(message: str, **attrs: Any) -> None:
@@ -165,8 +178,8 @@ def log_error(message: str, **attrs: Any) -> None:
     """
     if LOGFIRE_AVAILABLE and logfire is not None:
         logfire.error(message, **attrs)
-    else:
-        logger.error(f"{message} {attrs}")
+    elif logger.isEnabledFor(logging.ERROR):
+        logger.error("%s %s", message, attrs)
 
 
 def log_warning(message: str, **attrs: Any) -> None:
@@ -178,8 +191,8 @@ def log_warning(message: str, **attrs: Any) -> None:
     """
     if LOGFIRE_AVAILABLE and logfire is not None:
         logfire.warn(message, **attrs)
-    else:
-        logger.warning(f"{message} {attrs}")
+    elif logger.isEnabledFor(logging.WARNING):
+        logger.warning("%s %s", message, attrs)
 
 
 def _compute_event_hash(event_data: dict[str, Any]) -> str:
@@ -195,6 +208,29 @@ def _compute_event_hash(event_data: dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+@lru_cache(maxsize=8)
+def _load_signing_key(signing_key: str) -> rsa.RSAPrivateKey:
+    """Parse a PEM-encoded RSA private key, caching the parsed key object.
+
+    The PEM text is intentionally kept as the cache key for the life of the
+    process; the parsed key object is held in memory anyway, and the cache is
+    bounded to a handful of configured signing keys.
+
+    Args:
+        signing_key: PEM-encoded RSA private key
+
+    Returns:
+        Loaded RSA private key
+
+    Raises:
+        ValueError: If the PEM does not contain an RSA private key
+    """
+    key = serialization.load_pem_private_key(signing_key.encode(), password=None)
+    if not isinstance(key, rsa.RSAPrivateKey):
+        raise ValueError("RS256 signing requires an RSA private key")
+    return key
+
+
 def _sign_event(
     event_type: str, event_data: dict[str, Any], signing_key: str
 ) -> SignedEvent:
@@ -211,15 +247,25 @@ def _sign_event(
     timestamp = datetime.now(UTC).isoformat()
     event_hash = _compute_event_hash(event_data)
 
-    # Create payload to sign
-    payload = {
-        "timestamp": timestamp,
-        "event_type": event_type,
-        "event_hash": event_hash,
-    }
+    # Assemble the JSON payload bytes directly; timestamp and event_hash are
+    # plain ASCII, so only event_type needs escaping
+    payload = b"".join(
+        (
+            b'{"timestamp":"',
+            timestamp.encode(),
+            b'","event_type":',
+            orjson.dumps(event_type),
+            b',"event_hash":"',
+            event_hash.encode(),
+            b'"}',
+        )
+    )
 
-    # Sign with RSA-256
-    signature = jwt.encode(payload, signing_key, algorithm="RS256")
+    # Sign with RSA-256 as a compact JWS, reusing the precomputed header
+    signing_input = _JWS_HEADER_B64 + b"." + _b64url(payload)
+    key = _load_signing_key(signing_key)
+    raw_signature = key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    signature = (signing_input + b"." + _b64url(raw_signature)).decode()
 
     return SignedEvent(
         timestamp=timestamp,
@@ -290,7 +336,9 @@ def log_security_event(
         signed_event = _sign_event(event_type, event_data, signing_key)
         log_error(
             f"Security event: {event_type}",
-            signed_event=signed_event.model_dump(),
+            # Serialized once by pydantic-core instead of dumping to a dict
+            # that the log backend would walk and encode again
+            signed_event_json=signed_event.model_dump_json(),
             **event_data,
         )
     else:
@@ -3,7 +3,7 @@
 from ..legacy_tools import PythonEvalTool, create_python_eval_server
 from .base import Tool, ToolCapability, ToolExecutionContext, ToolResult
 from .builtin import *  # noqa: F403
-from .registry import ToolRegistry, global_tool_registry
+from .registry import ToolRegistry, gather_with_concurrency, global_tool_registry
 
 __all__ = [
     "Tool",
@@ -12,6 +12,7 @@ __all__ = [
     "ToolResult",
     "ToolRegistry",
     "global_tool_registry",
+    "gather_with_concurrency",
     "create_python_eval_server",
     "PythonEvalTool",
 ]
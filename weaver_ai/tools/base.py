@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToolCapability(str, Enum):
@@ -38,21 +41,30 @@ class ToolExecutionContext(BaseModel):
     max_retries: int = 3
 
 
-class ToolResult(BaseModel):
-    """Result from tool execution."""
+@dataclass(slots=True, kw_only=True)
+class ToolResult:
+    """Result from tool execution.
+
+    A slotted dataclass rather than a Pydantic model: one is built for every
+    tool call, always from trusted internal code, so validation buys nothing.
+    """
 
     success: bool
     data: Any
     error: str | None = None
     execution_time: float  # seconds
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
     cached: bool = False
     tool_name: str
     tool_version: str = "1.0.0"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to a dictionary."""
+        return asdict(self)
+
     def to_json(self) -> str:
         """Convert result to JSON string."""
-        return json.dumps(self.model_dump(), default=str)
+        return orjson.dumps(asdict(self), default=str).decode()
 
 
 class Tool(ABC, BaseModel):
@@ -76,8 +88,7 @@ class Tool(ABC, BaseModel):
     cache_enabled: bool = True
     cache_ttl: int = 300  # seconds
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @abstractmethod
     async def execute(
@@ -94,6 +105,32 @@ class Tool(ABC, BaseModel):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release resources held by the tool (e.g. HTTP clients).
+
+        Called by the registry when the tool is unregistered. Override in
+        tools that hold network connections.
+        """
+
+    def _fail(self, error: str, start_time: float) -> ToolResult:
+        """Build a failed result for this tool.
+
+        Args:
+            error: Error message
+            start_time: ``time.perf_counter()`` reading taken at the start
+
+        Returns:
+            Unsuccessful ToolResult timed from start_time
+        """
+        return ToolResult(
+            success=False,
+            data=None,
+            error=error,
+            execution_time=time.perf_counter() - start_time,
+            tool_name=self.name,
+            tool_version=self.version,
+        )
+
     def validate_args(self, args: dict[str, Any]) -> bool:
         """Validate input arguments against schema.
 
@@ -121,14 +158,13 @@ class Tool(ABC, BaseModel):
         Returns:
             Cache key string
         """
-        # Simple cache key - can be overridden for more complex logic
-        key_parts = [
-            self.name,
-            self.version,
-            json.dumps(args, sort_keys=True),
-            context.agent_id,
-        ]
-        return ":".join(key_parts)
+        # Fixed-length digest of the canonical args; the "name:" prefix is kept
+        # so per-tool cache entries stay identifiable. Can be overridden.
+        args_digest = hashlib.blake2b(
+            orjson.dumps(args, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+            digest_size=16,
+        ).hexdigest()
+        return f"{self.name}:{self.version}:{context.agent_id}:{args_digest}"
 
     def get_metrics(self) -> dict[str, Any]:
         """Get tool usage metrics.
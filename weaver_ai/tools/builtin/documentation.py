@@ -3,11 +3,86 @@
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 from typing import Any
 
+from pydantic import BaseModel
+
 from ..base import Tool, ToolCapability, ToolExecutionContext, ToolResult
 
 
+class _DocumentationArgs(BaseModel):
+    """Validated DocumentationTool arguments (mirrors input_schema)."""
+
+    library: str = ""
+    topic: str = ""
+    version: str = ""
+
+
+_RELATED_TOPICS = (
+    "Installation Guide",
+    "API Reference",
+    "Best Practices",
+    "Troubleshooting",
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_doc(library: str, topic: str, version: str) -> tuple[str, tuple[str, ...]]:
+    """Render the mock documentation page and examples for a query.
+
+    Args:
+        library: Library or framework name
+        topic: Specific topic (may be empty)
+        version: Library version (may be empty)
+
+    Returns:
+        Tuple of (markdown content, examples)
+    """
+    lc = library.lower()
+    pip_name = lc.replace(" ", "-")
+    py_name = lc.replace(" ", "_")
+
+    content = f"""
+# {library} Documentation
+
+## Overview
+This is the documentation for {library}{f' version {version}' if version else ''}.
+
+## {topic if topic else 'Getting Started'}
+
+{library} is a powerful library for building applications.
+
+### Installation
+```bash
+pip install {pip_name}
+```
+
+### Basic Usage
+```python
+import {py_name}
+
+# Example code here
+```
+
+### Key Features
+- Feature 1: Description
+- Feature 2: Description
+- Feature 3: Description
+"""
+
+    examples = (
+        f"# Example 1: Basic {library} usage",
+        f"# Example 2: Advanced {library} patterns",
+        (
+            f"# Example 3: {library} with {topic}"
+            if topic
+            else f"# Example 3: {library} best practices"
+        ),
+    )
+    return content, examples
+
+
 class DocumentationTool(Tool):
     """Tool for accessing documentation from various sources."""
 
@@ -68,79 +143,29 @@ class DocumentationTool(Tool):
         Returns:
             ToolResult with documentation content
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            library = args.get("library", "")
-            topic = args.get("topic", "")
-            version = args.get("version", "")
+            # One pydantic-core call validates types for every field at once
+            parsed = _DocumentationArgs.model_validate(args)
+            library, topic, version = parsed.library, parsed.topic, parsed.version
 
             if not library:
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error="Library name is required",
-                    execution_time=time.time() - start_time,
-                    tool_name=self.name,
-                    tool_version=self.version,
-                )
+                return self._fail("Library name is required", start_time)
 
             # This could integrate with context7 MCP server for real documentation
             # For now, return mock documentation
-            content = f"""
-# {library} Documentation
-
-## Overview
-This is the documentation for {library}{f' version {version}' if version else ''}.
-
-## {topic if topic else 'Getting Started'}
-
-{library} is a powerful library for building applications.
-
-### Installation
-```bash
-pip install {library.lower().replace(' ', '-')}
-```
-
-### Basic Usage
-```python
-import {library.lower().replace(' ', '_')}
-
-# Example code here
-```
-
-### Key Features
-- Feature 1: Description
-- Feature 2: Description
-- Feature 3: Description
-"""
-
-            examples = [
-                f"# Example 1: Basic {library} usage",
-                f"# Example 2: Advanced {library} patterns",
-                (
-                    f"# Example 3: {library} with {topic}"
-                    if topic
-                    else f"# Example 3: {library} best practices"
-                ),
-            ]
-
-            related_topics = [
-                "Installation Guide",
-                "API Reference",
-                "Best Practices",
-                "Troubleshooting",
-            ]
+            content, examples = _render_doc(library, topic, version)
 
             return ToolResult(
                 success=True,
                 data={
                     "library": library,
                     "content": content,
-                    "examples": examples,
-                    "related_topics": related_topics,
+                    "examples": list(examples),
+                    "related_topics": list(_RELATED_TOPICS),
                 },
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 tool_name=self.name,
                 tool_version=self.version,
                 metadata={
@@ -150,11 +175,4 @@ import {library.lower().replace(' ', '_')}
             )
 
         except Exception as e:
-            return ToolResult(
-                success=False,
-                data=None,
-                error=str(e),
-                execution_time=time.time() - start_time,
-                tool_name=self.name,
-                tool_version=self.version,
-            )
+            return self._fail(str(e), start_time)
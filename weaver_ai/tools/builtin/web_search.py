@@ -2,11 +2,162 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import time
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, ClassVar
 
 from ..base import Tool, ToolCapability, ToolExecutionContext, ToolResult
 
+logger = logging.getLogger(__name__)
+
+_RESULT_KEYS = frozenset(("title", "url", "snippet"))
+
+_decoder = json.JSONDecoder()
+
+# Characters that end a JSON token; a decode error followed only by other
+# characters may be a number or literal cut off by the end of the text
+_TOKEN_BREAKS = frozenset(' \t\r\n,:{}[]"')
+
+
+def _iter_matching(obj: Any, wanted_keys: frozenset[str]) -> Iterator[dict[str, Any]]:
+    """Yield obj if it carries all wanted keys, else matching objects inside it.
+
+    Args:
+        obj: Decoded JSON value
+        wanted_keys: Keys an object must contain to be yielded
+
+    Yields:
+        Matching objects, in document order
+    """
+    if isinstance(obj, dict):
+        if wanted_keys <= obj.keys():
+            yield obj
+            return
+        values = obj.values()
+    elif isinstance(obj, list):
+        values = obj
+    else:
+        return
+    for value in values:
+        yield from _iter_matching(value, wanted_keys)
+
+
+def _is_truncated(text: str, error: json.JSONDecodeError) -> bool:
+    """Whether a decode error may only mean that the text stopped too early.
+
+    Args:
+        text: Text that was being decoded
+        error: Error raised while decoding it
+
+    Returns:
+        True if appending more text could still make the object decode
+    """
+    if error.msg.startswith("Unterminated string"):
+        return True
+    return _TOKEN_BREAKS.isdisjoint(text[error.pos :])
+
+
+def _iter_json_objects(
+    text: str, wanted_keys: frozenset[str] = _RESULT_KEYS
+) -> Iterator[dict[str, Any]]:
+    """Yield JSON objects embedded in free text that carry all wanted keys.
+
+    Scans left to right, decoding at each "{" and jumping past every object
+    that parses. Objects lacking the keys are searched for nested matches,
+    so results wrapped as {"results": [...]} are found too.
+
+    Args:
+        text: Text that may contain JSON objects
+        wanted_keys: Keys an object must contain to be yielded
+
+    Yields:
+        Matching decoded objects, in order of appearance
+    """
+    i = text.find("{")
+    while i != -1:
+        try:
+            obj, end = _decoder.raw_decode(text, i)
+        except ValueError:
+            i = text.find("{", i + 1)
+            continue
+        yield from _iter_matching(obj, wanted_keys)
+        i = text.find("{", end)
+
+
+class _JSONObjectStream:
+    """Incrementally extract result objects from streamed text.
+
+    Text is fed chunk by chunk; each complete object is decoded as soon as
+    its closing brace arrives. A "{" that fails to decode is skipped unless
+    the failure is at the end of the text received so far, in which case
+    the object may simply be incomplete and is retried on the next chunk.
+    Only text from that point on is kept.
+    """
+
+    def __init__(self, wanted_keys: frozenset[str] = _RESULT_KEYS):
+        self._wanted_keys = wanted_keys
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Add streamed text and return objects completed by it.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Newly completed objects carrying all wanted keys
+        """
+        buffer = self._buffer + chunk
+        found: list[dict[str, Any]] = []
+        i = buffer.find("{")
+        while i != -1:
+            try:
+                obj, end = _decoder.raw_decode(buffer, i)
+            except json.JSONDecodeError as e:
+                if _is_truncated(buffer, e):
+                    # Possibly incomplete; retry from here on the next chunk
+                    self._buffer = buffer[i:]
+                    return found
+                i = buffer.find("{", i + 1)
+                continue
+            found.extend(_iter_matching(obj, self._wanted_keys))
+            i = buffer.find("{", end)
+        self._buffer = ""
+        return found
+
+    def close(self) -> list[dict[str, Any]]:
+        """Finish the stream, skipping anything left that is not valid JSON.
+
+        Returns:
+            Remaining objects carrying all wanted keys
+        """
+        rest = self._buffer
+        self._buffer = ""
+        return list(_iter_json_objects(rest, self._wanted_keys))
+
+
+def _fallback_results(query: str, max_results: int) -> list[dict[str, Any]]:
+    """Build placeholder results for when real web search is unavailable.
+
+    Args:
+        query: Search query
+        max_results: Maximum number of results requested
+
+    Returns:
+        Up to three placeholder results mentioning the query
+    """
+    return [
+        {
+            "title": f"Fallback result {i+1} for: {query}",
+            "url": f"https://example.com/result{i+1}",
+            "snippet": f"Fallback snippet for result {i+1} about {query}...",
+        }
+        for i in range(min(max_results, 3))
+    ]
+
 
 class WebSearchTool(Tool):
     """Tool for searching the web."""
@@ -16,6 +167,11 @@ class WebSearchTool(Tool):
     capabilities: list[ToolCapability] = [ToolCapability.WEB_SEARCH]
     required_scopes: list[str] = ["tool:web_search"]
 
+    # Shared AsyncAnthropic client, reused across instances and searches
+    _client: ClassVar[Any] = None
+    _client_key: ClassVar[str | None] = None
+    _client_loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+
     input_schema: dict[str, Any] = {
         "type": "object",
         "properties": {
@@ -51,6 +207,43 @@ class WebSearchTool(Tool):
         },
     }
 
+    @classmethod
+    def _get_client(cls, api_key: str) -> Any:
+        """Return the shared AsyncAnthropic client, creating it on first use.
+
+        The client's connection pool is bound to the event loop it was first
+        used on, so a new client is created if the running loop or the API key
+        changes.
+
+        Args:
+            api_key: Anthropic API key
+
+        Returns:
+            Pooled AsyncAnthropic client
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            cls._client is None
+            or cls._client_key != api_key
+            or cls._client_loop is not loop
+        ):
+            import anthropic
+
+            cls._client = anthropic.AsyncAnthropic(api_key=api_key)
+            cls._client_key = api_key
+            cls._client_loop = loop
+        return cls._client
+
+    async def aclose(self) -> None:
+        """Close the shared Anthropic client, if one was created."""
+        cls = type(self)
+        client, loop = cls._client, cls._client_loop
+        cls._client = None
+        cls._client_key = None
+        cls._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
     async def execute(
         self,
         args: dict[str, Any],
@@ -65,21 +258,14 @@ class WebSearchTool(Tool):
         Returns:
             ToolResult with search results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             query = args.get("query", "")
             max_results = args.get("max_results", 5)
 
             if not query:
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error="Query is required",
-                    execution_time=time.time() - start_time,
-                    tool_name=self.name,
-                    tool_version=self.version,
-                )
+                return self._fail("Query is required", start_time)
 
             # Perform real web search
             try:
@@ -91,12 +277,13 @@ class WebSearchTool(Tool):
 
                 if anthropic_key:
                     # Use real web search via Anthropic SDK
-                    import anthropic
-
-                    client = anthropic.Anthropic(api_key=anthropic_key)
+                    client = self._get_client(anthropic_key)
 
-                    # Create a simple message to trigger web search
-                    message = client.messages.create(
+                    # Stream the reply and stop as soon as enough results
+                    # have been parsed out of it
+                    results: list[dict[str, Any]] = []
+                    parser = _JSONObjectStream()
+                    async with client.messages.stream(
                         model="claude-3-5-sonnet-20241022",
                         max_tokens=2048,
                         messages=[
@@ -109,31 +296,19 @@ class WebSearchTool(Tool):
                                 ),
                             }
                         ],
-                    )
-
-                    # Parse results from response
-                    import json
-                    import re
-
-                    results = []
-                    for block in message.content:
-                        if hasattr(block, "text"):
-                            text = block.text
-                            # Try to extract JSON objects
-                            json_matches = re.findall(
-                                r'\{[^{}]*"title"[^{}]*"url"[^{}]*"snippet"[^{}]*\}',
-                                text,
-                            )
-                            for match in json_matches[:max_results]:
-                                try:
-                                    result_data = json.loads(match)
-                                    results.append(result_data)
-                                except (json.JSONDecodeError, ValueError, KeyError):
-                                    pass
+                    ) as stream:
+                        async for text in stream.text_stream:
+                            results.extend(parser.feed(text))
+                            if len(results) >= max_results:
+                                break
+                        else:
+                            results.extend(parser.close())
+                    del results[max_results:]
 
                     if results:
-                        print(
-                            f"Web search returned {len(results)} results from Anthropic"
+                        logger.debug(
+                            "Web search returned %d results from Anthropic",
+                            len(results),
                         )
                     else:
                         raise Exception("No structured results from web search")
@@ -143,15 +318,8 @@ class WebSearchTool(Tool):
 
             except Exception as search_error:
                 # Fall back to mock results if web search fails
-                print(f"Web search error: {search_error}, using fallback")
-                results = [
-                    {
-                        "title": f"Fallback result {i+1} for: {query}",
-                        "url": f"https://example.com/result{i+1}",
-                        "snippet": f"Fallback snippet for result {i+1} about {query}...",
-                    }
-                    for i in range(min(max_results, 3))
-                ]
+                logger.debug("Web search error: %s, using fallback", search_error)
+                results = _fallback_results(query, max_results)
 
             return ToolResult(
                 success=True,
@@ -160,7 +328,7 @@ class WebSearchTool(Tool):
                     "query": query,
                     "total_results": len(results),
                 },
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
                 tool_name=self.name,
                 tool_version=self.version,
                 metadata={
@@ -170,11 +338,4 @@ class WebSearchTool(Tool):
             )
 
         except Exception as e:
-            return ToolResult(
-                success=False,
-                data=None,
-                error=str(e),
-                execution_time=time.time() - start_time,
-                tool_name=self.name,
-                tool_version=self.version,
-            )
+            return self._fail(str(e), start_time)
@@ -3,26 +3,87 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import heapq
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable
+from dataclasses import replace
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from ..mcp import MCPClient, MCPServer
-from ..security.rbac import check_access
+from ..security.rbac import check_access, load_roles
 from .base import Tool, ToolCapability, ToolExecutionContext, ToolResult
 
 
+async def gather_with_concurrency(
+    limit: int, *aws: Awaitable[Any], return_exceptions: bool = False
+) -> list[Any]:
+    """Await many awaitables concurrently, at most ``limit`` at a time.
+
+    Prefer this over a ``for`` loop of ``await`` when the calls are
+    independent I/O: waits overlap instead of adding up.
+
+    Args:
+        limit: Maximum number of awaitables running at once
+        *aws: Awaitables to run
+        return_exceptions: Return exceptions as results instead of raising
+
+    Returns:
+        Results in the order the awaitables were given
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(bounded(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
 class ToolRegistry:
     """Central registry for all available tools."""
 
-    def __init__(self):
-        """Initialize the tool registry."""
+    # Seconds between background sweeps of expired cache entries
+    CACHE_SWEEP_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        cache_max_entries: int = 10_000,
+        roles_path: Path = Path("weaver_ai/policies/roles.yaml"),
+    ):
+        """Initialize the tool registry.
+
+        Args:
+            cache_max_entries: Upper bound on cached results; the least
+                recently used entry is evicted first
+            roles_path: RBAC role file used for permission checks
+        """
         self._tools: dict[str, Tool] = {}
         self._capability_map: dict[ToolCapability, set[str]] = defaultdict(set)
         self._mcp_clients: dict[str, MCPClient] = {}
-        self._cache: dict[str, ToolResult] = {}
+        # cache_key -> (monotonic expiry, tool name, result), kept in LRU order
+        self._cache: OrderedDict[str, tuple[float, str, ToolResult]] = OrderedDict()
+        # tool name -> its keys in _cache, so a tool's entries drop in O(k)
+        self._cache_by_tool: dict[str, set[str]] = defaultdict(set)
+        # (expiry, cache_key) min-heap; entries may be stale after overwrites
+        self._expiry_heap: list[tuple[float, str]] = []
+        # cache_key -> result of the execution currently in flight
+        self._inflight: dict[str, asyncio.Future[ToolResult]] = {}
+        self._cache_max_entries = cache_max_entries
+        self._sweeper: asyncio.Task[None] | None = None
         self._usage_stats: dict[str, dict[str, Any]] = defaultdict(dict)
         self._lock = asyncio.Lock()
+        self._roles_path = roles_path
+        # (user_id, tool_name) -> (roles the verdict used, denial or None)
+        self._rbac_cache: dict[
+            tuple[str, str], tuple[dict[str, list[str]], str | None]
+        ] = {}
+        # Parse the role file up front rather than on the first tool call
+        load_roles(roles_path)
 
     async def register_tool(self, tool: Tool) -> None:
         """Register a tool in the registry.
@@ -35,18 +96,20 @@ class ToolRegistry:
                 raise ValueError(f"Tool {tool.name} already registered")
 
             self._tools[tool.name] = tool
+            self._rbac_cache.clear()
 
             # Update capability mapping
             for capability in tool.capabilities:
                 self._capability_map[capability].add(tool.name)
 
+            self._ensure_sweeper()
+
             # Initialize usage stats
             self._usage_stats[tool.name] = {
                 "total_calls": 0,
                 "successful_calls": 0,
                 "failed_calls": 0,
                 "total_execution_time": 0.0,
-                "average_execution_time": 0.0,
                 "last_used": None,
             }
 
@@ -68,13 +131,13 @@ class ToolRegistry:
 
             # Remove tool
             del self._tools[tool_name]
+            self._rbac_cache.clear()
 
             # Clear cache entries for this tool
-            cache_keys_to_remove = [
-                key for key in self._cache.keys() if key.startswith(f"{tool_name}:")
-            ]
-            for key in cache_keys_to_remove:
-                del self._cache[key]
+            for key in self._cache_by_tool.pop(tool_name, ()):
+                self._cache.pop(key, None)
+
+            await tool.aclose()
 
     def get_tool(self, tool_name: str) -> Tool | None:
         """Get a tool by name.
@@ -152,33 +215,23 @@ class ToolRegistry:
 
         # Check permissions if required
         if check_permissions and tool.required_scopes:
-            from pathlib import Path
-
-            from ..security.auth import UserContext
-
-            # Create UserContext from execution context
-            user_context = UserContext(user_id=context.user_id)
-
-            roles_path = Path("weaver_ai/policies/roles.yaml")
-            for scope in tool.required_scopes:
-                try:
-                    check_access(user_context, scope, roles_path=roles_path)
-                except Exception as e:
-                    return ToolResult(
-                        success=False,
-                        data=None,
-                        error=f"Permission denied: {str(e)}",
-                        execution_time=0,
-                        tool_name=tool_name,
-                    )
+            denied = self._check_permissions(tool, context)
+            if denied is not None:
+                return ToolResult(
+                    success=False,
+                    data=None,
+                    error=f"Permission denied: {denied}",
+                    execution_time=0,
+                    tool_name=tool_name,
+                )
 
         # Check cache if enabled
         if tool.cache_enabled:
             cache_key = tool.get_cache_key(args, context)
-            if cache_key in self._cache:
-                cached_result = self._cache[cache_key]
-                cached_result.cached = True
-                return cached_result
+            cached_result = self._cache_get(cache_key)
+            if cached_result is not None:
+                # A copy, so callers never mutate the shared cache entry
+                return replace(cached_result, cached=True)
 
         # Validate arguments
         try:
@@ -192,34 +245,76 @@ class ToolRegistry:
                 tool_name=tool_name,
             )
 
-        # Execute tool with timeout
-        import time
+        if not tool.cache_enabled:
+            return await self._run_tool(tool, tool_name, args, context, None)
+
+        # Coalesce identical concurrent calls onto one execution. If the
+        # executing call is cancelled, its waiters retry, one of them taking
+        # over the execution; only a waiter's own cancellation is raised.
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                continue
+            return replace(result)
+
+        future: asyncio.Future[ToolResult] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._run_tool(tool, tool_name, args, context, cache_key)
+        except BaseException:
+            # Waiters retry rather than hanging
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[cache_key]
+        future.set_result(result)
+        return result
+
+    async def _run_tool(
+        self,
+        tool: Tool,
+        tool_name: str,
+        args: dict[str, Any],
+        context: ToolExecutionContext,
+        cache_key: str | None,
+    ) -> ToolResult:
+        """Execute a validated tool call, recording stats and caching success.
+
+        Args:
+            tool: Tool to execute
+            tool_name: Name the tool is registered under
+            args: Tool arguments
+            context: Execution context
+            cache_key: Key to cache a successful result under, or None
 
-        start_time = time.time()
+        Returns:
+            ToolResult from execution
+        """
+        # Execute tool with timeout
+        start_time = time.perf_counter()
 
         try:
             result = await asyncio.wait_for(
                 tool.execute(args, context),
                 timeout=context.timeout,
             )
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             result.execution_time = execution_time
 
             # Update usage stats
-            await self._update_stats(tool_name, result)
+            self._update_stats(tool_name, result)
 
             # Cache successful result if enabled
-            if tool.cache_enabled and result.success:
-                cache_key = tool.get_cache_key(args, context)
-                self._cache[cache_key] = result
-
-                # Schedule cache expiration
-                asyncio.create_task(self._expire_cache(cache_key, tool.cache_ttl))
+            if cache_key is not None and result.success:
+                self._cache_put(tool_name, cache_key, replace(result), tool.cache_ttl)
 
             return result
 
         except TimeoutError:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             result = ToolResult(
                 success=False,
                 data=None,
@@ -227,11 +322,11 @@ class ToolRegistry:
                 execution_time=execution_time,
                 tool_name=tool_name,
             )
-            await self._update_stats(tool_name, result)
+            self._update_stats(tool_name, result)
             return result
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             result = ToolResult(
                 success=False,
                 data=None,
@@ -239,40 +334,196 @@ class ToolRegistry:
                 execution_time=execution_time,
                 tool_name=tool_name,
             )
-            await self._update_stats(tool_name, result)
+            self._update_stats(tool_name, result)
             return result
 
-    async def _update_stats(self, tool_name: str, result: ToolResult) -> None:
+    async def execute_many(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        context: ToolExecutionContext,
+        check_permissions: bool = True,
+        max_concurrency: int = 32,
+    ) -> list[ToolResult]:
+        """Execute several tool calls concurrently.
+
+        Args:
+            calls: List of (tool_name, args) tuples
+            context: Execution context shared by every call
+            check_permissions: Whether to check RBAC permissions
+            max_concurrency: Maximum number of calls in flight at once
+
+        Returns:
+            One ToolResult per call, in call order
+        """
+        results = await gather_with_concurrency(
+            max_concurrency,
+            *(
+                self.execute_tool(name, args, context, check_permissions)
+                for name, args in calls
+            ),
+            return_exceptions=True,
+        )
+        return [
+            (
+                ToolResult(
+                    success=False,
+                    data=None,
+                    error=str(result),
+                    execution_time=0,
+                    tool_name=name,
+                )
+                if isinstance(result, BaseException)
+                else result
+            )
+            for (name, _), result in zip(calls, results, strict=True)
+        ]
+
+    def _check_permissions(
+        self, tool: Tool, context: ToolExecutionContext
+    ) -> str | None:
+        """Check the caller holds every scope the tool requires.
+
+        Verdicts are memoized per (user, tool) and reused until the role
+        file changes.
+
+        Args:
+            tool: Tool about to be executed
+            context: Execution context
+
+        Returns:
+            None if access is granted, otherwise the denial reason
+        """
+        roles = load_roles(self._roles_path)
+        key = (context.user_id, tool.name)
+        cached = self._rbac_cache.get(key)
+        # load_roles returns the same object until the file changes
+        if cached is not None and cached[0] is roles:
+            return cached[1]
+
+        from ..security.auth import UserContext
+
+        # Create UserContext from execution context
+        user_context = UserContext(user_id=context.user_id)
+
+        denied = None
+        for scope in tool.required_scopes:
+            try:
+                check_access(user_context, scope, roles=roles)
+            except Exception as e:
+                denied = str(e)
+                break
+
+        if len(self._rbac_cache) >= self._cache_max_entries:
+            self._rbac_cache.clear()
+        self._rbac_cache[key] = (roles, denied)
+        return denied
+
+    def _update_stats(self, tool_name: str, result: ToolResult) -> None:
         """Update usage statistics for a tool.
 
+        Runs without awaiting, so the updates cannot interleave with another
+        task's and need no lock. The average is derived in get_stats().
+
         Args:
             tool_name: Name of the tool
             result: Execution result
         """
-        async with self._lock:
-            stats = self._usage_stats[tool_name]
-            stats["total_calls"] += 1
+        stats = self._usage_stats[tool_name]
+        stats["total_calls"] += 1
 
-            if result.success:
-                stats["successful_calls"] += 1
-            else:
-                stats["failed_calls"] += 1
+        if result.success:
+            stats["successful_calls"] += 1
+        else:
+            stats["failed_calls"] += 1
 
-            stats["total_execution_time"] += result.execution_time
-            stats["average_execution_time"] = (
-                stats["total_execution_time"] / stats["total_calls"]
-            )
-            stats["last_used"] = datetime.now().isoformat()
+        stats["total_execution_time"] += result.execution_time
+        stats["last_used"] = datetime.now().isoformat()
 
-    async def _expire_cache(self, cache_key: str, ttl: int) -> None:
-        """Expire a cache entry after TTL.
+    def _cache_get(self, cache_key: str) -> ToolResult | None:
+        """Return a fresh cached result, dropping it if it has expired.
 
         Args:
-            cache_key: Cache key to expire
+            cache_key: Cache key to look up
+
+        Returns:
+            Cached result or None
+        """
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._cache_drop(cache_key)
+            return None
+        self._cache.move_to_end(cache_key)
+        return entry[2]
+
+    def _cache_put(
+        self, tool_name: str, cache_key: str, result: ToolResult, ttl: float
+    ) -> None:
+        """Cache a result, evicting the least recently used entry if full.
+
+        Args:
+            tool_name: Name of the tool that produced the result
+            cache_key: Cache key
+            result: Result to cache
             ttl: Time to live in seconds
         """
-        await asyncio.sleep(ttl)
-        self._cache.pop(cache_key, None)
+        expiry = time.monotonic() + ttl
+        self._cache[cache_key] = (expiry, tool_name, result)
+        self._cache.move_to_end(cache_key)
+        heapq.heappush(self._expiry_heap, (expiry, cache_key))
+        # Rebuild once overwrites and evictions leave mostly stale heap entries
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(exp, key) for key, (exp, _, _) in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+        self._cache_by_tool[tool_name].add(cache_key)
+        if len(self._cache) > self._cache_max_entries:
+            self._cache_drop(next(iter(self._cache)))
+
+    def _cache_drop(self, cache_key: str) -> None:
+        """Remove a cache entry and its per-tool index entry.
+
+        Args:
+            cache_key: Cache key to remove
+        """
+        _, tool_name, _ = self._cache.pop(cache_key)
+        keys = self._cache_by_tool.get(tool_name)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._cache_by_tool[tool_name]
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background cache sweeper on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._sweeper is None
+            or self._sweeper.done()
+            or self._sweeper.get_loop() is not loop
+        ):
+            self._sweeper = loop.create_task(self._sweep_cache())
+
+    async def _sweep_cache(self) -> None:
+        """Periodically drop expired cache entries that are never read again."""
+        while True:
+            await asyncio.sleep(self.CACHE_SWEEP_INTERVAL)
+            self._expire_due(time.monotonic())
+
+    def _expire_due(self, now: float) -> None:
+        """Drop cache entries whose expiry has passed, soonest first.
+
+        Only due heap entries are visited, rather than the whole cache.
+
+        Args:
+            now: Current monotonic time
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip keys evicted or rewritten with a later expiry since
+            if entry is not None and entry[0] == expiry:
+                self._cache_drop(key)
 
     def get_stats(self, tool_name: str | None = None) -> dict[str, Any]:
         """Get usage statistics.
@@ -284,8 +535,22 @@ class ToolRegistry:
             Usage statistics
         """
         if tool_name:
-            return self._usage_stats.get(tool_name, {})
-        return dict(self._usage_stats)
+            stats = self._usage_stats.get(tool_name)
+            return self._with_average(stats) if stats is not None else {}
+        return {
+            name: self._with_average(stats) for name, stats in self._usage_stats.items()
+        }
+
+    @staticmethod
+    def _with_average(stats: dict[str, Any]) -> dict[str, Any]:
+        """Copy tool stats, adding the average execution time."""
+        calls = stats["total_calls"]
+        return {
+            **stats,
+            "average_execution_time": (
+                stats["total_execution_time"] / calls if calls else 0.0
+            ),
+        }
 
     async def register_mcp_server(
         self, server_id: str, server: MCPServer, client: MCPClient
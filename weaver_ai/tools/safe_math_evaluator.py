@@ -13,12 +13,137 @@ from __future__ import annotations
 import ast
 import math
 import operator
-from typing import Any, ClassVar
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from ..mcp import ToolSpec
+
+# Security check: No dangerous names (plus any dunder)
+_FORBIDDEN_NAMES = frozenset(
+    [
+        "import",
+        "exec",
+        "eval",
+        "compile",
+        "open",
+        "file",
+        "input",
+        "raw_input",
+        "execfile",
+        "reload",
+        "vars",
+        "globals",
+        "locals",
+        "getattr",
+        "setattr",
+        "delattr",
+        "classmethod",
+        "staticmethod",
+        "property",
+        "super",
+        "type",
+        "isinstance",
+        "issubclass",
+        "callable",
+        "format",
+        "repr",
+        "ascii",
+        "ord",
+        "chr",
+        "bin",
+        "hex",
+        "oct",
+        "dir",
+        "help",
+        "id",
+        "hash",
+        "object",
+        "str",
+        "bytes",
+        "bytearray",
+        "memoryview",
+        "complex",
+        "bool",
+        "list",
+        "tuple",
+        "range",
+        "dict",
+        "set",
+        "frozenset",
+        "enumerate",
+        "zip",
+        "reversed",
+        "sorted",
+        "filter",
+        "map",
+        "all",
+        "any",
+        "iter",
+        "next",
+        "slice",
+        "divmod",
+        "pow",
+    ]
+)
+
+
+def _parse_number(text: str) -> int | float | None:
+    """Convert a plain decimal literal, optionally negated, without ast.
+
+    Only forms that Python would parse to the same value are accepted, so
+    anything else (exponents, leading zeros, "inf") takes the AST path.
+
+    Args:
+        text: Stripped expression text
+
+    Returns:
+        The number, or None if the text is not a plain literal
+    """
+    body = text[1:] if text[:1] == "-" else text
+    if not body.isascii():
+        return None
+    if body.isdigit():
+        if body[0] == "0" and len(body) > 1:
+            return None
+        return int(text)
+    if body.count(".") == 1 and body.replace(".", "", 1).isdigit():
+        return float(text)
+    return None
 
-from pydantic import BaseModel
 
+@lru_cache(maxsize=512)
+def _parse_and_check(expression: str) -> ast.expr:
+    """Parse an expression and screen its names against the forbidden set.
 
-class SafeMathEvaluator(BaseModel):
+    Cached per expression string, so repeated expressions skip ast.parse and
+    the screening walk; the returned tree is only read, never mutated.
+
+    Args:
+        expression: Mathematical expression to parse
+
+    Returns:
+        Body of the parsed expression
+
+    Raises:
+        ValueError: If the expression contains a forbidden keyword
+        SyntaxError: If the expression does not parse
+    """
+    tree = ast.parse(expression, mode="eval").body
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute):
+            raise ValueError("Attribute access not allowed in expression")
+        if isinstance(node, ast.Name):
+            name = node.id.lower()
+            if name in _FORBIDDEN_NAMES or name.startswith("__"):
+                raise ValueError(f"Forbidden keyword '{name}' in expression")
+    return tree
+
+
+class SafeMathEvaluator:
     """Safe mathematical expression evaluator using AST parsing.
 
     This evaluator:
@@ -28,43 +153,52 @@ class SafeMathEvaluator(BaseModel):
     - No access to Python builtins or imports
     """
 
-    # Allowed operators (no exec, eval, or dangerous operations)
-    ALLOWED_OPS: ClassVar[dict] = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
-        ast.FloorDiv: operator.floordiv,
-        ast.Mod: operator.mod,
-        ast.Pow: operator.pow,
-        ast.USub: operator.neg,
-        ast.UAdd: operator.pos,
-    }
+    # Allowed operators (no exec, eval, or dangerous operations); the
+    # whitelists are read-only views so they cannot be widened at runtime
+    ALLOWED_OPS: ClassVar[Mapping[type[ast.AST], Callable[..., Any]]] = (
+        MappingProxyType(
+            {
+                ast.Add: operator.add,
+                ast.Sub: operator.sub,
+                ast.Mult: operator.mul,
+                ast.Div: operator.truediv,
+                ast.FloorDiv: operator.floordiv,
+                ast.Mod: operator.mod,
+                ast.Pow: operator.pow,
+                ast.USub: operator.neg,
+                ast.UAdd: operator.pos,
+            }
+        )
+    )
 
     # Allowed math functions (safe, deterministic functions only)
-    ALLOWED_FUNCTIONS: ClassVar[dict] = {
-        "abs": abs,
-        "round": round,
-        "min": min,
-        "max": max,
-        "sum": sum,
-        "sqrt": math.sqrt,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "log": math.log,
-        "log10": math.log10,
-        "exp": math.exp,
-        "floor": math.floor,
-        "ceil": math.ceil,
-    }
+    ALLOWED_FUNCTIONS: ClassVar[Mapping[str, Callable[..., Any]]] = MappingProxyType(
+        {
+            "abs": abs,
+            "round": round,
+            "min": min,
+            "max": max,
+            "sum": sum,
+            "sqrt": math.sqrt,
+            "sin": math.sin,
+            "cos": math.cos,
+            "tan": math.tan,
+            "log": math.log,
+            "log10": math.log10,
+            "exp": math.exp,
+            "floor": math.floor,
+            "ceil": math.ceil,
+        }
+    )
 
     # Allowed constants
-    ALLOWED_CONSTANTS: ClassVar[dict] = {
-        "pi": math.pi,
-        "e": math.e,
-        "tau": math.tau,
-    }
+    ALLOWED_CONSTANTS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "pi": math.pi,
+            "e": math.e,
+            "tau": math.tau,
+        }
+    )
 
     # Security limits
     MAX_EXPRESSION_LENGTH: ClassVar[int] = 500
@@ -73,6 +207,30 @@ class SafeMathEvaluator(BaseModel):
     MAX_RESULT_SIZE: ClassVar[float] = 1e100
     MAX_POWER_EXPONENT: ClassVar[float] = 1000
 
+    # Expressions have no variables, so a result depends only on the text
+    RESULT_CACHE_SIZE: ClassVar[int] = 256
+
+    def __init__(self) -> None:
+        """Initialize the evaluator with an empty result cache."""
+        self._results: OrderedDict[str, float | int] = OrderedDict()
+        # Integer form of the bound, so int results are compared int to int
+        self._max_int = int(self.MAX_NUMBER_SIZE)
+
+    def _too_large(self, value: Any) -> bool:
+        """Check a computed value against MAX_NUMBER_SIZE.
+
+        Args:
+            value: Result of an operation or function call
+
+        Returns:
+            True if the value is a number beyond the allowed magnitude
+        """
+        if type(value) is int:
+            return abs(value) > self._max_int
+        if type(value) is float:
+            return abs(value) > self.MAX_NUMBER_SIZE
+        return isinstance(value, int | float) and abs(value) > self.MAX_NUMBER_SIZE
+
     def evaluate(self, expression: str) -> float | int:
         """Safely evaluate a mathematical expression.
 
@@ -86,8 +244,8 @@ class SafeMathEvaluator(BaseModel):
             ValueError: If expression is invalid or unsafe
             OverflowError: If result would be too large
         """
-        # Input validation
-        if not expression or not expression.strip():
+        # Input validation; length first, before any copy of the input is made
+        if not expression:
             raise ValueError("Empty expression")
 
         if len(expression) > self.MAX_EXPRESSION_LENGTH:
@@ -95,87 +253,28 @@ class SafeMathEvaluator(BaseModel):
                 f"Expression too long (max {self.MAX_EXPRESSION_LENGTH} chars)"
             )
 
-        # Security check: No dangerous keywords
-        dangerous_keywords = [
-            "__",
-            "import",
-            "exec",
-            "eval",
-            "compile",
-            "open",
-            "file",
-            "input",
-            "raw_input",
-            "execfile",
-            "reload",
-            "vars",
-            "globals",
-            "locals",
-            "getattr",
-            "setattr",
-            "delattr",
-            "classmethod",
-            "staticmethod",
-            "property",
-            "super",
-            "type",
-            "isinstance",
-            "issubclass",
-            "callable",
-            "format",
-            "repr",
-            "ascii",
-            "ord",
-            "chr",
-            "bin",
-            "hex",
-            "oct",
-            "dir",
-            "help",
-            "id",
-            "hash",
-            "object",
-            "str",
-            "bytes",
-            "bytearray",
-            "memoryview",
-            "complex",
-            "bool",
-            "list",
-            "tuple",
-            "range",
-            "dict",
-            "set",
-            "frozenset",
-            "enumerate",
-            "zip",
-            "reversed",
-            "sorted",
-            "filter",
-            "map",
-            "all",
-            "any",
-            "iter",
-            "next",
-            "slice",
-            "divmod",
-            "pow",
-            "compile",
-            "exec",
-            "eval",
-        ]
-
-        expression_lower = expression.lower()
-        for keyword in dangerous_keywords:
-            if keyword in expression_lower:
-                raise ValueError(f"Forbidden keyword '{keyword}' in expression")
+        stripped = expression.strip()
+        if not stripped:
+            raise ValueError("Empty expression")
+
+        # Plain numbers need no parse tree
+        number = _parse_number(stripped)
+        if number is not None:
+            if abs(number) > self.MAX_NUMBER_SIZE:
+                raise ValueError(f"Number too large (max {self.MAX_NUMBER_SIZE})")
+            return number
+
+        cached = self._results.get(expression)
+        if cached is not None:
+            self._results.move_to_end(expression)
+            return cached
 
         try:
-            # Parse the expression into an AST
-            tree = ast.parse(expression, mode="eval")
+            # Parse the expression into an AST (cached per expression string)
+            tree = _parse_and_check(expression)
 
             # Evaluate the AST safely
-            result = self._eval_node(tree.body, depth=0)
+            result = self._eval_node(tree, depth=0)
 
             # Validate result
             if isinstance(result, int | float):
@@ -183,6 +282,9 @@ class SafeMathEvaluator(BaseModel):
                     raise OverflowError(
                         f"Result too large (max {self.MAX_RESULT_SIZE})"
                     )
+                self._results[expression] = result
+                if len(self._results) > self.RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
                 return result
             else:
                 raise ValueError(f"Invalid result type: {type(result).__name__}")
@@ -211,145 +313,145 @@ class SafeMathEvaluator(BaseModel):
                 f"Expression too complex (max depth {self.MAX_RECURSION_DEPTH})"
             )
 
-        # Numbers
-        if isinstance(node, ast.Constant):
-            if isinstance(node.value, int | float):
-                if abs(node.value) > self.MAX_NUMBER_SIZE:
-                    raise ValueError(f"Number too large (max {self.MAX_NUMBER_SIZE})")
-                return node.value
-            raise ValueError(
-                f"Only numeric constants allowed, got {type(node.value).__name__}"
-            )
-
-        # For Python < 3.8 compatibility
-        if isinstance(node, ast.Num):  # pragma: no cover
-            if abs(node.n) > self.MAX_NUMBER_SIZE:
+        # One exact-type lookup instead of an isinstance chain
+        handler = _NODE_HANDLERS.get(type(node))
+        if handler is None:
+            # Any other node type is not allowed
+            raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+        return handler(self, node, depth)
+
+    def _eval_constant(self, node: ast.Constant, depth: int) -> Any:
+        """Evaluate a numeric literal."""
+        if isinstance(node.value, int | float):
+            if abs(node.value) > self.MAX_NUMBER_SIZE:
                 raise ValueError(f"Number too large (max {self.MAX_NUMBER_SIZE})")
-            return node.n
-
-        # Names (constants and variables)
-        if isinstance(node, ast.Name):
-            if node.id in self.ALLOWED_CONSTANTS:
-                return self.ALLOWED_CONSTANTS[node.id]
-            raise ValueError(f"Unknown variable or constant: {node.id}")
-
-        # Binary operations
-        if isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left, depth + 1)
-            right = self._eval_node(node.right, depth + 1)
-
-            # Special validation for power operations
-            if isinstance(node.op, ast.Pow):
-                if abs(right) > self.MAX_POWER_EXPONENT:
+            return node.value
+        raise ValueError(
+            f"Only numeric constants allowed, got {type(node.value).__name__}"
+        )
+
+    def _eval_name(self, node: ast.Name, depth: int) -> Any:
+        """Evaluate a named constant such as pi."""
+        value = self.ALLOWED_CONSTANTS.get(node.id)
+        if value is not None:
+            return value
+        raise ValueError(f"Unknown variable or constant: {node.id}")
+
+    def _eval_binop(self, node: ast.BinOp, depth: int) -> Any:
+        """Evaluate a binary operation."""
+        left = self._eval_node(node.left, depth + 1)
+        right = self._eval_node(node.right, depth + 1)
+
+        # Special validation for power operations
+        if isinstance(node.op, ast.Pow):
+            if abs(right) > self.MAX_POWER_EXPONENT:
+                raise ValueError(f"Exponent too large (max {self.MAX_POWER_EXPONENT})")
+
+        # Special validation for division
+        if isinstance(node.op, ast.Div | ast.FloorDiv | ast.Mod):
+            if right == 0:
+                raise ValueError("Division by zero")
+
+        op_func = self.ALLOWED_OPS.get(type(node.op))
+        if op_func:
+            try:
+                result = op_func(left, right)
+                if self._too_large(result):
+                    raise OverflowError("Intermediate result too large")
+                return result
+            except OverflowError as e:
+                raise OverflowError(
+                    "Mathematical operation resulted in overflow"
+                ) from e
+        else:
+            raise ValueError(f"Unsupported operation: {type(node.op).__name__}")
+
+    def _eval_unaryop(self, node: ast.UnaryOp, depth: int) -> Any:
+        """Evaluate a unary operation."""
+        operand = self._eval_node(node.operand, depth + 1)
+        op_func = self.ALLOWED_OPS.get(type(node.op))
+        if op_func:
+            return op_func(operand)
+        else:
+            raise ValueError(f"Unsupported unary operation: {type(node.op).__name__}")
+
+    def _eval_call(self, node: ast.Call, depth: int) -> Any:
+        """Evaluate a call to an allowed math function."""
+        if isinstance(node.func, ast.Name):
+            func_name = node.func.id
+            func = self.ALLOWED_FUNCTIONS.get(func_name)
+            if func is not None:
+                # Evaluate all arguments
+                args = [self._eval_node(arg, depth + 1) for arg in node.args]
+
+                # No keyword arguments allowed for simplicity
+                if node.keywords:
                     raise ValueError(
-                        f"Exponent too large (max {self.MAX_POWER_EXPONENT})"
+                        "Keyword arguments not supported in function calls"
                     )
 
-            # Special validation for division
-            if isinstance(node.op, ast.Div | ast.FloorDiv | ast.Mod):
-                if right == 0:
-                    raise ValueError("Division by zero")
-
-            op_func = self.ALLOWED_OPS.get(type(node.op))
-            if op_func:
                 try:
-                    result = op_func(left, right)
-                    if (
-                        isinstance(result, int | float)
-                        and abs(result) > self.MAX_NUMBER_SIZE
-                    ):
-                        raise OverflowError("Intermediate result too large")
+                    result = func(*args)
+                    if self._too_large(result):
+                        raise OverflowError("Function result too large")
                     return result
-                except OverflowError as e:
-                    raise OverflowError(
-                        "Mathematical operation resulted in overflow"
-                    ) from e
-            else:
-                raise ValueError(f"Unsupported operation: {type(node.op).__name__}")
-
-        # Unary operations
-        if isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand, depth + 1)
-            op_func = self.ALLOWED_OPS.get(type(node.op))
-            if op_func:
-                return op_func(operand)
-            else:
-                raise ValueError(
-                    f"Unsupported unary operation: {type(node.op).__name__}"
-                )
-
-        # Function calls
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                func_name = node.func.id
-                if func_name in self.ALLOWED_FUNCTIONS:
-                    # Evaluate all arguments
-                    args = [self._eval_node(arg, depth + 1) for arg in node.args]
-
-                    # No keyword arguments allowed for simplicity
-                    if node.keywords:
-                        raise ValueError(
-                            "Keyword arguments not supported in function calls"
-                        )
-
-                    try:
-                        result = self.ALLOWED_FUNCTIONS[func_name](*args)
-                        if (
-                            isinstance(result, int | float)
-                            and abs(result) > self.MAX_NUMBER_SIZE
-                        ):
-                            raise OverflowError("Function result too large")
-                        return result
-                    except Exception as e:
-                        raise ValueError(f"Error in function {func_name}: {e}") from e
-                else:
-                    raise ValueError(f"Function '{func_name}' is not allowed")
+                except Exception as e:
+                    raise ValueError(f"Error in function {func_name}: {e}") from e
             else:
-                raise ValueError("Complex function calls not supported")
+                raise ValueError(f"Function '{func_name}' is not allowed")
+        else:
+            raise ValueError("Complex function calls not supported")
 
-        # Lists (for functions like sum, min, max)
-        if isinstance(node, ast.List):
-            return [self._eval_node(elem, depth + 1) for elem in node.elts]
+    def _eval_list(self, node: ast.List, depth: int) -> Any:
+        """Evaluate a list literal (for functions like sum, min, max)."""
+        return [self._eval_node(elem, depth + 1) for elem in node.elts]
 
-        # Comparisons not allowed (could be used for information leakage)
-        if isinstance(node, ast.Compare):
-            raise ValueError("Comparison operations not allowed in math expressions")
+    def _reject_compare(self, node: ast.Compare, depth: int) -> Any:
+        """Comparisons not allowed (could be used for information leakage)."""
+        raise ValueError("Comparison operations not allowed in math expressions")
 
-        # Boolean operations not allowed
-        if isinstance(node, ast.BoolOp):
-            raise ValueError("Boolean operations not allowed in math expressions")
+    def _reject_boolop(self, node: ast.BoolOp, depth: int) -> Any:
+        """Boolean operations not allowed."""
+        raise ValueError("Boolean operations not allowed in math expressions")
 
-        # Any other node type is not allowed
-        raise ValueError(f"Unsupported expression type: {type(node).__name__}")
 
+# Exact node type -> SafeMathEvaluator handler
+_NODE_HANDLERS: dict[type[ast.AST], Callable[[SafeMathEvaluator, Any, int], Any]] = {
+    ast.Constant: SafeMathEvaluator._eval_constant,
+    ast.Name: SafeMathEvaluator._eval_name,
+    ast.BinOp: SafeMathEvaluator._eval_binop,
+    ast.UnaryOp: SafeMathEvaluator._eval_unaryop,
+    ast.Call: SafeMathEvaluator._eval_call,
+    ast.List: SafeMathEvaluator._eval_list,
+    ast.Compare: SafeMathEvaluator._reject_compare,
+    ast.BoolOp: SafeMathEvaluator._reject_boolop,
+}
 
-def create_safe_math_server(server_id: str, key: str):
-    """Create an MCP server with safe math evaluation.
 
-    This is a secure replacement for create_python_eval_server.
+# Shared by every safe math server; the evaluator only holds a bounded cache
+_EVALUATOR = SafeMathEvaluator()
 
-    Args:
-        server_id: Server identifier
-        key: Authentication key
 
-    Returns:
-        MCPServer instance with safe math tool
-    """
-    from ..mcp import MCPServer, ToolSpec
+def _safe_eval(args: dict) -> dict:
+    """Wrapper for MCP tool interface."""
+    try:
+        expr = args.get("expr", "")
+        result = _EVALUATOR.evaluate(expr)
+        return {"result": result, "success": True}
+    except Exception as e:
+        return {"error": str(e), "success": False}
 
-    server = MCPServer(server_id, key)
-    evaluator = SafeMathEvaluator()
 
-    def safe_eval(args: dict) -> dict:
-        """Wrapper for MCP tool interface."""
-        try:
-            expr = args.get("expr", "")
-            result = evaluator.evaluate(expr)
-            return {"result": result, "success": True}
-        except Exception as e:
-            return {"error": str(e), "success": False}
+@lru_cache(maxsize=1)
+def _safe_math_spec() -> ToolSpec:
+    """Build the safe math tool spec once; it never changes.
+
+    Returns:
+        ToolSpec for the safe_math_eval tool
+    """
+    from ..mcp import ToolSpec
 
-    spec = ToolSpec(
+    return ToolSpec(
         name="safe_math_eval",
         description="Safely evaluate mathematical expressions",
         input_schema={
@@ -372,5 +474,21 @@ def create_safe_math_server(server_id: str, key: str):
         },
     )
 
-    server.add_tool(spec, safe_eval)
+
+def create_safe_math_server(server_id: str, key: str):
+    """Create an MCP server with safe math evaluation.
+
+    This is a secure replacement for create_python_eval_server.
+
+    Args:
+        server_id: Server identifier
+        key: Authentication key
+
+    Returns:
+        MCPServer instance with safe math tool
+    """
+    from ..mcp import MCPServer
+
+    server = MCPServer(server_id, key)
+    server.add_tool(_safe_math_spec(), _safe_eval)
     return server
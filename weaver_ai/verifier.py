@@ -1,18 +1,50 @@
 from __future__ import annotations
 
-import re
 from collections.abc import Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Digits or arithmetic operators suggest the answer needs a calculation tool
+_TOOL_CHARS = frozenset("0123456789+-*/")
+
+# Deletes every other ASCII character, so a long ASCII query scans in one
+# C-level translate pass; below the cutoff the set check is cheaper
+_KEEP_TOOL_CHARS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in _TOOL_CHARS)
+)
+_TRANSLATE_MIN_LENGTH = 32
+
+
+def _has_tool_chars(query: str) -> bool:
+    # Characters outside the table survive translate, so only ASCII qualifies
+    if len(query) >= _TRANSLATE_MIN_LENGTH and query.isascii():
+        return bool(query.translate(_KEEP_TOOL_CHARS))
+    return not _TOOL_CHARS.isdisjoint(query)
 
 
 class VerificationResult(BaseModel):
+    # Frozen so the canonical instances below can be shared between calls
+    model_config = ConfigDict(frozen=True)
+
     groundedness: float
     tool_required: bool
     success: bool
     reason: str | None = None
 
 
+# Every verdict is one of four outcomes, so build each model once
+_RESULTS = {
+    (grounded, tool_required): VerificationResult(
+        groundedness=1.0 if grounded else 0.0,
+        tool_required=tool_required,
+        success=not tool_required,
+        reason="tool required" if tool_required else None,
+    )
+    for grounded in (True, False)
+    for tool_required in (True, False)
+}
+
+
 class Verifier:
     def verify(
         self,
@@ -21,15 +53,6 @@ class Verifier:
         citations: Sequence[str],
         tools_used: Sequence[str],
     ) -> VerificationResult:
-        need_tool = bool(re.search(r"[\d+\-*/]", query))
-        used = "python_eval" in tools_used
-        tool_required = need_tool and not used
-        success = not tool_required
-        groundedness = 1.0 if citations else 0.0
-        reason = None if success else "tool required"
-        return VerificationResult(
-            groundedness=groundedness,
-            tool_required=tool_required,
-            success=success,
-            reason=reason,
-        )
+        # Short-circuit: skip the tool lookup when no calculation is needed
+        tool_required = _has_tool_chars(query) and "python_eval" not in tools_used
+        return _RESULTS[bool(citations), tool_required]
@@ -3,21 +3,96 @@
 from __future__ import annotations
 
 import asyncio
-import uuid
+import contextlib
+import logging
+import os
+import time
+from collections import OrderedDict, deque
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from weaver_ai.agents import BaseAgent
 from weaver_ai.agents.discovery import TypeBasedRouter
-from weaver_ai.agents.error_handling import ErrorStrategy, RetryWithBackoff
+from weaver_ai.agents.error_handling import (
+    ErrorStrategy,
+    FailFast,
+    RetryWithBackoff,
+    SkipOnError,
+)
 from weaver_ai.events import Event
 from weaver_ai.models import ModelRouter
+from weaver_ai.models.anthropic_adapter import AnthropicAdapter
+from weaver_ai.models.mock import MockAdapter
+from weaver_ai.models.openai_adapter import OpenAIAdapter
 from weaver_ai.redis import RedisEventMesh
 
+logger = logging.getLogger(__name__)
+
+# Providers by a substring of the lowercased model name, checked in order:
+# (marker, API key environment variable, adapter factory)
+_MODEL_PROVIDERS: tuple[tuple[str, str, Callable[[str, str], Any]], ...] = (
+    (
+        "gpt",
+        "OPENAI_API_KEY",
+        lambda model, key: OpenAIAdapter(model=model, api_key=key),
+    ),
+    (
+        "claude",
+        "ANTHROPIC_API_KEY",
+        lambda model, key: AnthropicAdapter(api_key=key, default_model=model),
+    ),
+)
+
+# Error strategy classes by the names accepted in the fluent API
+_ERROR_STRATEGIES: dict[str, type[ErrorStrategy]] = {
+    "retry": RetryWithBackoff,
+    "fail_fast": FailFast,
+    "skip": SkipOnError,
+}
+
+
+@lru_cache(maxsize=1)
+def _iso_second(seconds: int) -> str:
+    """Format a Unix second as an ISO 8601 UTC prefix, cached per second."""
+    return datetime.fromtimestamp(seconds, UTC).isoformat()[:19]
+
+
+def _iso_timestamp(timestamp_ns: int) -> str:
+    """Format a nanosecond Unix timestamp like datetime.isoformat() in UTC.
+
+    Events flushed in one batch mostly share their second, so only the
+    microsecond suffix is formatted per event.
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    micros = nanos // 1000
+    if micros:
+        return f"{_iso_second(seconds)}.{micros:06d}+00:00"
+    return f"{_iso_second(seconds)}+00:00"
+
+
+class WorkflowCycleError(RuntimeError):
+    """Raised when routing sends one agent more revisits than allowed."""
+
+    def __init__(self, agent_id: str, hop_counts: dict[str, int]):
+        """Initialize the error.
+
+        Args:
+            agent_id: Agent whose revisit limit was exceeded
+            hop_counts: Times each agent ran before the workflow was stopped
+        """
+        super().__init__(
+            f"Routing cycle detected: agent {agent_id!r} ran "
+            f"{hop_counts[agent_id]} times"
+        )
+        self.agent_id = agent_id
+        self.hop_counts = hop_counts
+
 
 class WorkflowState(str, Enum):
     """Workflow execution states."""
@@ -42,24 +117,34 @@ class WorkflowResult(BaseModel):
     metrics: dict[str, Any] = Field(default_factory=dict)
 
 
-class AgentConfig(BaseModel):
-    """Configuration for an agent in a workflow."""
+@dataclass(slots=True, kw_only=True)
+class AgentConfig:
+    """Configuration for an agent in a workflow.
+
+    A slotted dataclass rather than a Pydantic model: it is only built by
+    add_agent and read on every hop, so validation buys nothing.
+    """
 
     agent_class: type[BaseAgent]
-    instance_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
-    error_strategy: ErrorStrategy = Field(default_factory=RetryWithBackoff)
+    instance_id: str = field(default_factory=lambda: os.urandom(16).hex())
+    error_strategy: ErrorStrategy = field(default_factory=RetryWithBackoff)
     model_name: str | None = None  # Specific model for this agent
     api_key: str | None = None  # Agent-specific API key (BYOK)
-    model_settings: dict[str, Any] = Field(default_factory=dict)  # Model settings
-    agent_settings: dict[str, Any] = Field(
+    model_settings: dict[str, Any] = field(default_factory=dict)  # Model settings
+    agent_settings: dict[str, Any] = field(
         default_factory=dict
     )  # Additional agent configuration
 
 
-class RouteCondition(BaseModel):
-    """Conditional routing between agents."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RouteCondition:
+    """Conditional routing between agents.
+
+    A route with neither a condition nor a result type is unconditional.
+    """
 
-    condition: Callable[[Any], bool]
+    condition: Callable[[Any], bool] | None = None
+    result_type: type[Any] | None = None
     from_agent: str
     to_agent: str
     priority: int = 0
@@ -77,6 +162,17 @@ class Workflow:
         result = await workflow.run(input_data)
     """
 
+    # Progress events are buffered and published in pipelined batches
+    PROGRESS_FLUSH_INTERVAL = 0.01
+    PROGRESS_BATCH_SIZE = 100
+    PROGRESS_STREAM_MAXLEN = 10_000
+
+    # Entries kept by the opt-in agent result cache (least recently used go)
+    RESULT_CACHE_SIZE = 1024
+
+    # Agents initialized at once, to bound connection fan-out on large workflows
+    MAX_CONCURRENT_INITS = 16
+
     def __init__(self, name: str, redis_url: str = "redis://localhost:6379"):
         """Initialize a new workflow.
 
@@ -85,27 +181,39 @@ class Workflow:
             redis_url: Redis connection URL
         """
         self.name = name
-        self.workflow_id = f"{name}_{uuid.uuid4().hex[:8]}"
+        self.workflow_id = f"{name}_{os.urandom(4).hex()}"
         self.redis_url = redis_url
 
         # Agent configuration
         self.agents: list[AgentConfig] = []
         self.agent_instances: dict[str, BaseAgent] = {}
+        self._agent_config_by_id: dict[str, AgentConfig] = {}
 
         # Routing configuration
         self.routes: list[RouteCondition] = []
+        self._routes_by_from: dict[str, list[RouteCondition]] = {}
         self.type_router: TypeBasedRouter | None = None
+        self._route_cache: dict[type, str | None] = {}
 
         # Workflow configuration
         self.observability_enabled = False
+        self.progress_sink = "pubsub"
         self.intervention_enabled = False
         self.timeout_seconds: int | None = None
+        self.max_revisits = 8
         self.default_error_strategy: ErrorStrategy = RetryWithBackoff()
+        self.result_cache_enabled = False
+        self._result_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
 
         # Runtime state
         self.mesh: RedisEventMesh | None = None
+        self._keep_connections = False
         self.model_router: ModelRouter | None = None
+        self._agent_routers: dict[tuple[str, str | None], ModelRouter] = {}
         self.state = WorkflowState.PENDING
+        self._progress_buffer: list[tuple[str, dict[str, Any]]] = []
+        self._progress_flush_task: asyncio.Task | None = None
+        self._interventions: deque[str] = deque()
 
     def add_agent(
         self,
@@ -158,17 +266,18 @@ class Workflow:
         if max_tokens is not None:
             model_settings["max_tokens"] = max_tokens
 
-        self.agents.append(
-            AgentConfig(
-                agent_class=agent_class,
-                instance_id=instance_id,
-                error_strategy=error_strategy,
-                model_name=model,
-                api_key=api_key,
-                model_settings=model_settings,
-                agent_settings=config,
-            )
+        agent_config = AgentConfig(
+            agent_class=agent_class,
+            instance_id=instance_id,
+            error_strategy=error_strategy,
+            model_name=model,
+            api_key=api_key,
+            model_settings=model_settings,
+            agent_settings=config,
         )
+        self.agents.append(agent_config)
+        # First registration wins, as with the former scan over self.agents
+        self._agent_config_by_id.setdefault(instance_id, agent_config)
 
         return self
 
@@ -187,7 +296,7 @@ class Workflow:
 
     def add_route(
         self,
-        when: Callable[[Any], bool],
+        when: Callable[[Any], bool] | None,
         from_agent: str,
         to_agent: str,
         priority: int = 0,
@@ -195,7 +304,8 @@ class Workflow:
         """Add a conditional route between agents.
 
         Args:
-            when: Condition function that returns True to activate route
+            when: Condition function that returns True to activate route,
+                or None for a route that always applies
             from_agent: Source agent instance ID
             to_agent: Target agent instance ID
             priority: Route priority (higher = higher priority)
@@ -203,7 +313,7 @@ class Workflow:
         Returns:
             Self for chaining
         """
-        self.routes.append(
+        return self._add_route(
             RouteCondition(
                 condition=when,
                 from_agent=from_agent,
@@ -211,8 +321,47 @@ class Workflow:
                 priority=priority,
             )
         )
+
+    def add_type_route(
+        self,
+        from_agent: str,
+        to_agent: str,
+        result_type: type[Any],
+        priority: int = 0,
+    ) -> Workflow:
+        """Add a route taken when the source agent's output is of a type.
+
+        Matching uses isinstance on the unwrapped output, the same value
+        type-based routing looks at, so no condition function is called.
+
+        Args:
+            from_agent: Source agent instance ID
+            to_agent: Target agent instance ID
+            result_type: Output type that activates the route
+            priority: Route priority (higher = higher priority)
+
+        Returns:
+            Self for chaining
+        """
+        return self._add_route(
+            RouteCondition(
+                result_type=result_type,
+                from_agent=from_agent,
+                to_agent=to_agent,
+                priority=priority,
+            )
+        )
+
+    def _add_route(self, route: RouteCondition) -> Workflow:
+        """Register a route, keeping the route lists sorted by priority."""
+        self.routes.append(route)
         # Sort routes by priority
         self.routes.sort(key=lambda r: r.priority, reverse=True)
+
+        # Per-source bucket, so each hop only checks routes leaving its agent
+        bucket = self._routes_by_from.setdefault(route.from_agent, [])
+        bucket.append(route)
+        bucket.sort(key=lambda r: r.priority, reverse=True)
         return self
 
     def with_error_handling(
@@ -238,16 +387,27 @@ class Workflow:
         )
         return self
 
-    def with_observability(self, enabled: bool = True) -> Workflow:
+    def with_observability(
+        self, enabled: bool = True, sink: str = "pubsub"
+    ) -> Workflow:
         """Enable/disable workflow observability.
 
         Args:
             enabled: Whether to publish intermediate results
+            sink: "pubsub" to publish progress on the workflow.progress
+                channel, or "stream" to append it to the persistent
+                workflow.progress.<workflow_id> Redis stream
 
         Returns:
             Self for chaining
+
+        Raises:
+            ValueError: If the sink is not supported
         """
+        if sink not in ("pubsub", "stream"):
+            raise ValueError(f"Unknown progress sink: {sink}")
         self.observability_enabled = enabled
+        self.progress_sink = sink
         return self
 
     def with_intervention(self, enabled: bool = True) -> Workflow:
@@ -262,6 +422,23 @@ class Workflow:
         self.intervention_enabled = enabled
         return self
 
+    def with_result_cache(self, enabled: bool = True) -> Workflow:
+        """Enable/disable reuse of agent results for repeated inputs.
+
+        Only enable this when every agent is a pure function of its input;
+        a cached agent is skipped entirely, side effects included.
+
+        Args:
+            enabled: Whether to memoize results per agent and input
+
+        Returns:
+            Self for chaining
+        """
+        self.result_cache_enabled = enabled
+        if not enabled:
+            self._result_cache.clear()
+        return self
+
     def with_timeout(self, seconds: int) -> Workflow:
         """Set workflow execution timeout.
 
@@ -274,6 +451,22 @@ class Workflow:
         self.timeout_seconds = seconds
         return self
 
+    def with_max_revisits(self, revisits: int) -> Workflow:
+        """Set how often routing may send the same agent its work again.
+
+        Workflows may take any number of hops through distinct agents; only
+        an agent running more than 1 + revisits times in one run is treated
+        as a routing cycle and fails the run with WorkflowCycleError.
+
+        Args:
+            revisits: Runs allowed per agent beyond its first
+
+        Returns:
+            Self for chaining
+        """
+        self.max_revisits = revisits
+        return self
+
     def discover_tools(self) -> Workflow:
         """Auto-discover and register MCP tools.
 
@@ -324,10 +517,11 @@ class Workflow:
             # Execute workflow
             if self.timeout_seconds:
                 final_result = await asyncio.wait_for(
-                    self._execute(input_data), timeout=self.timeout_seconds
+                    self._execute(input_data, result.agent_results),
+                    timeout=self.timeout_seconds,
                 )
             else:
-                final_result = await self._execute(input_data)
+                final_result = await self._execute(input_data, result.agent_results)
 
             result.result = final_result
             result.state = WorkflowState.COMPLETED
@@ -344,14 +538,15 @@ class Workflow:
             result.error = str(e)
             result.state = WorkflowState.FAILED
 
-            # Check if any agent has fail_fast strategy
-            for agent_config in self.agents:
-                if (
-                    hasattr(agent_config.error_strategy, "should_fail_workflow")
-                    and agent_config.error_strategy.should_fail_workflow()
-                ):
-                    # Re-raise for fail-fast strategy
-                    raise
+            # Re-raise if any agent's strategy fails the workflow. Asked on
+            # each failure, since e.g. a circuit breaker's answer changes.
+            # AgentConfig validates every strategy as an ErrorStrategy, which
+            # always defines should_fail_workflow().
+            if any(
+                agent_config.error_strategy.should_fail_workflow()
+                for agent_config in self.agents
+            ):
+                raise
 
         finally:
             result.end_time = datetime.now(UTC)
@@ -359,43 +554,112 @@ class Workflow:
 
         return result
 
+    async def __aenter__(self) -> Workflow:
+        """Keep the workflow's connections open across runs.
+
+        Inside ``async with workflow:``, repeated ``run()`` calls reuse one
+        event mesh connection instead of reconnecting each time; it is
+        closed when the block exits.
+        """
+        self._keep_connections = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the connections kept open by __aenter__."""
+        self._keep_connections = False
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the workflow's event mesh connection, if open."""
+        if self.mesh:
+            mesh, self.mesh = self.mesh, None
+            await mesh.close()
+
     async def _initialize(self):
         """Initialize workflow connections."""
-        # Setup event mesh
-        self.mesh = RedisEventMesh(self.redis_url)
-        await self.mesh.connect()
+        # Publish progress off the hot loop, one pipeline per batch
+        if self.observability_enabled:
+            self._progress_flush_task = asyncio.create_task(self._flush_progress_loop())
+        self._interventions.clear()
 
         # Setup model router if not provided
         if self.model_router is None:
-            from weaver_ai.models import ModelRouter
-
             self.model_router = ModelRouter()
 
+        # Reuse the event mesh kept open from an earlier run
+        if self.mesh is not None:
+            return
+
+        # Setup event mesh
+        self.mesh = RedisEventMesh(self.redis_url)
+        await self.mesh.connect()
+
+        # Receive intervention requests in the background, so checking for
+        # one on each hop never waits on Redis
+        if self.intervention_enabled:
+            try:
+                await self.mesh.subscribe(
+                    [f"channel:{self.intervention_channel}"],
+                    self._on_intervention,
+                    agent_id=self.workflow_id,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to subscribe to workflow interventions: {e}")
+
     async def _create_agents(self):
         """Create and initialize agent instances."""
         if not self.agents:
             raise IndexError("Cannot run workflow with no agents")
 
-        for agent_config in self.agents:
-            # Create agent instance
-            agent = agent_config.agent_class(**agent_config.agent_settings)
+        # Agents connect independently, so initialize them concurrently
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_INITS)
 
-            # Create model router for this specific agent if model is specified
-            if agent_config.model_name:
-                model_router = await self._create_agent_router(
-                    model_name=agent_config.model_name,
-                    api_key=agent_config.api_key,
-                    config=agent_config.model_settings,
-                )
+        async def create(agent_config: AgentConfig) -> BaseAgent:
+            async with semaphore:
+                return await self._create_agent(agent_config)
+
+        results = await asyncio.gather(
+            *(create(agent_config) for agent_config in self.agents),
+            return_exceptions=True,
+        )
+
+        # Store instances in registration order; the first agent is the
+        # routing fallback. Successful ones are kept so _cleanup sees them.
+        error = None
+        for agent_config, agent in zip(self.agents, results, strict=True):
+            if isinstance(agent, BaseException):
+                error = error or agent
             else:
-                # Use shared/default router
-                model_router = self.model_router
+                self.agent_instances[agent_config.instance_id] = agent
+        if error is not None:
+            raise error
 
-            # Initialize with connections
-            await agent.initialize(redis_url=self.redis_url, model_router=model_router)
+    async def _create_agent(self, agent_config: AgentConfig) -> BaseAgent:
+        """Create and initialize a single agent instance.
 
-            # Store instance
-            self.agent_instances[agent_config.instance_id] = agent
+        Args:
+            agent_config: Configuration of the agent to create
+
+        Returns:
+            Initialized agent instance
+        """
+        # Create agent instance
+        agent = agent_config.agent_class(**agent_config.agent_settings)
+
+        # Create model router for this specific agent if model is specified
+        if agent_config.model_name:
+            model_router = await self._create_agent_router(
+                model_name=agent_config.model_name,
+                api_key=agent_config.api_key,
+                config=agent_config.model_settings,
+            )
+        else:
+            # Use shared/default router
+            model_router = self.model_router
+
+        # Initialize with connections
+        await agent.initialize(redis_url=self.redis_url, model_router=model_router)
+        return agent
 
     async def _create_agent_router(
         self, model_name: str, api_key: str | None, config: dict[str, Any]
@@ -410,82 +674,80 @@ class Workflow:
         Returns:
             Configured ModelRouter for the agent
         """
-        import os
-
-        from weaver_ai.models import ModelRouter
-        from weaver_ai.models.anthropic_adapter import AnthropicAdapter
-        from weaver_ai.models.mock import MockAdapter
-        from weaver_ai.models.openai_adapter import OpenAIAdapter
+        # Agents on the same model and key share one router and its adapter
+        cache_key = (model_name, api_key)
+        router = self._agent_routers.get(cache_key)
+        if router is not None:
+            return router
 
         router = ModelRouter()
 
         # Determine model type and create appropriate adapter
-        if "gpt" in model_name.lower():
-            # OpenAI model
-            api_key = api_key or os.getenv("OPENAI_API_KEY")
-            if api_key:
-                adapter = OpenAIAdapter(model=model_name)
-                # Pass API key through environment for security
-                os.environ["OPENAI_API_KEY"] = api_key
-            else:
-                # Fall back to mock if no API key
-                adapter = MockAdapter(name=f"mock_{model_name}")
-        elif "claude" in model_name.lower():
-            # Anthropic model
-            api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-            if api_key:
-                adapter = AnthropicAdapter(model=model_name)
-                # Pass API key through environment for security
-                os.environ["ANTHROPIC_API_KEY"] = api_key
+        name_lower = model_name.lower()
+        for marker, key_env, make_adapter in _MODEL_PROVIDERS:
+            if marker in name_lower:
+                api_key = api_key or os.getenv(key_env)
+                if api_key:
+                    adapter = make_adapter(model_name, api_key)
+                else:
+                    # Fall back to mock if no API key
+                    adapter = MockAdapter(name=f"mock_{model_name}")
+                break
+        else:
+            if model_name.startswith("mock"):
+                # Mock model (no API key needed)
+                adapter = MockAdapter(name=model_name)
             else:
-                # Fall back to mock if no API key
+                # Unknown model type, fall back to mock
                 adapter = MockAdapter(name=f"mock_{model_name}")
-        elif model_name == "mock" or model_name.startswith("mock"):
-            # Mock model (no API key needed)
-            adapter = MockAdapter(name=model_name)
-        else:
-            # Unknown model type, fall back to mock
-            adapter = MockAdapter(name=f"mock_{model_name}")
 
         # Register the adapter
         router.register(model_name, adapter)
         router.default_model = model_name
 
+        self._agent_routers[cache_key] = router
         return router
 
     def _setup_routing(self):
         """Setup type-based routing."""
-        from weaver_ai.agents.discovery import TypeBasedRouter
-
         # Create type router
         self.type_router = TypeBasedRouter()
+        self._route_cache.clear()
 
         # Analyze agent types
         for agent_id, agent in self.agent_instances.items():
             self.type_router.register_agent(agent_id, agent)
 
-    async def _execute(self, input_data: Any) -> Any:
-        """Execute the workflow logic."""
+    async def _execute(
+        self, input_data: Any, agent_results: dict[str, Any] | None = None
+    ) -> Any:
+        """Execute the workflow logic.
+
+        Args:
+            input_data: Initial input for the workflow
+            agent_results: Filled with each agent's latest output, keyed by
+                instance ID, as the run progresses; agent_instances is never
+                modified here
+
+        Returns:
+            Output of the last agent to run
+        """
         current_data = input_data
         current_agent_id = None
 
         # Find the first agent that can process the input
         first_agent_id = None
         if self.type_router:
-            first_agent_id = self.type_router.find_agent_for_type(type(input_data))
+            first_agent_id = self._find_agent_for_type(type(input_data))
         if not first_agent_id:
             # Use the first registered agent as fallback
-            first_agent_id = list(self.agent_instances.keys())[0]
+            first_agent_id = next(iter(self.agent_instances))
 
         current_agent_id = first_agent_id
+        hop_counts: dict[str, int] = {}
 
         # Process through the workflow
-        max_iterations = 100  # Prevent infinite loops
-        iteration = 0
-
-        while current_agent_id and iteration < max_iterations:
-            iteration += 1
-
+        while current_agent_id:
             # Get current agent
             agent = self.agent_instances[current_agent_id]
             agent_config = self._get_agent_config(current_agent_id)
@@ -503,36 +765,54 @@ class Workflow:
                     current_agent_id = intervention
                     continue
 
+            # Stop routing cycles as soon as an agent exceeds its revisits
+            hops = hop_counts.get(current_agent_id, 0) + 1
+            if hops > self.max_revisits + 1:
+                raise WorkflowCycleError(current_agent_id, hop_counts)
+            hop_counts[current_agent_id] = hops
+
             # Process with error handling
             try:
-                # Create event for agent - preserve BaseModel instances
-                event = Event(
-                    event_type=current_data.__class__.__name__,
-                    data=current_data,
-                )
-
-                # Process with the agent
-                result = await self._process_with_error_handling(
-                    agent, event, agent_config.error_strategy
+                # Reuse an earlier result for this agent and input if cached
+                cache_key = (
+                    self._result_cache_key(current_agent_id, current_data)
+                    if self.result_cache_enabled
+                    else None
                 )
+                result = self._cached_result(cache_key)
+                if result is None:
+                    # Create event for agent - preserve BaseModel instances
+                    event = Event(
+                        event_type=current_data.__class__.__name__,
+                        data=current_data,
+                    )
+
+                    # Process with the agent under its error handling strategy
+                    strategy = agent_config.error_strategy
+                    if strategy.is_passthrough:
+                        result = await agent.process(event)
+                    else:
+                        result = await strategy.execute(agent.process, event)
+                    self._cache_result(cache_key, result)
 
                 if result is None:
                     break
 
-                # Store agent result (but don't overwrite the agent instance)
-                # Results are tracked in workflow result metadata
+                # Unwrap Event-like results with one attribute probe
+                output = getattr(result, "data", result)
+                if agent_results is not None:
+                    agent_results[current_agent_id] = output
 
                 # Find next agent
                 next_agent_id = await self._find_next_agent(
                     current_agent_id, result, current_data
                 )
-
                 if next_agent_id:
-                    current_data = result.data if hasattr(result, "data") else result
+                    current_data = output
                     current_agent_id = next_agent_id
                 else:
                     # No more agents, return final result
-                    return result.data if hasattr(result, "data") else result
+                    return output
 
             except Exception:
                 if agent_config.error_strategy.should_fail_workflow():
@@ -548,57 +828,157 @@ class Workflow:
 
         return current_data
 
-    async def _process_with_error_handling(
-        self, agent: BaseAgent, event: Event, strategy: ErrorStrategy
-    ) -> Any:
-        """Process event with error handling strategy."""
-        return await strategy.execute(agent.process, event)
+    @staticmethod
+    def _result_cache_key(agent_id: str, data: Any) -> tuple[Any, ...] | None:
+        """Build the result cache key for an agent and its input.
+
+        Args:
+            agent_id: Agent instance ID
+            data: Input the agent is about to process
+
+        Returns:
+            Cache key, or None if the input cannot be keyed
+        """
+        if isinstance(data, BaseModel):
+            return agent_id, type(data), data.model_dump_json()
+        try:
+            hash(data)
+        except TypeError:
+            return None
+        return agent_id, type(data), data
+
+    def _cached_result(self, cache_key: tuple[Any, ...] | None) -> Any:
+        """Return the cached result for a key, or None on a miss."""
+        if cache_key is None:
+            return None
+        result = self._result_cache.get(cache_key)
+        if result is not None:
+            self._result_cache.move_to_end(cache_key)
+        return result
+
+    def _cache_result(self, cache_key: tuple[Any, ...] | None, result: Any):
+        """Store an agent result, evicting the least recently used entry."""
+        if cache_key is None or result is None:
+            return
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     async def _find_next_agent(
         self, current_agent_id: str, result: Any, data: Any
     ) -> str | None:
         """Find the next agent to process."""
+        output = getattr(result, "data", result)
+
         # Check manual routes first
-        for route in self.routes:
-            if route.from_agent == current_agent_id:
-                if route.condition(result):
+        for route in self._routes_by_from.get(current_agent_id, ()):
+            if route.result_type is not None:
+                if isinstance(output, route.result_type):
                     return route.to_agent
+            elif route.condition is None or route.condition(result):
+                return route.to_agent
 
         # Fall back to type-based routing
-        if result and hasattr(result, "data"):
-            result_type = type(result.data)
-        elif result:
-            result_type = type(result)
-        else:
+        if not result:
             return None
+        result_type = type(output)
 
         if self.type_router:
-            return self.type_router.find_agent_for_type(result_type)
+            return self._find_agent_for_type(result_type)
 
         return None
 
+    def _find_agent_for_type(self, data_type: type) -> str | None:
+        """Find the agent for a data type, memoized per type.
+
+        The type router is only populated in _setup_routing, which also
+        clears this cache, so a type's answer cannot change in between.
+        """
+        try:
+            return self._route_cache[data_type]
+        except KeyError:
+            agent_id = self.type_router.find_agent_for_type(data_type)
+            self._route_cache[data_type] = agent_id
+            return agent_id
+
     async def _publish_progress(self, agent_id: str, data: Any):
         """Publish workflow progress for observability."""
         if self.mesh:
             progress_event = {
                 "workflow_id": self.workflow_id,
                 "agent_id": agent_id,
-                "timestamp": datetime.now(UTC).isoformat(),
+                # Clock read only; the ISO string is formatted at flush time
+                "timestamp_ns": time.time_ns(),
                 "data_type": type(data).__name__,
             }
-            await self.mesh.publish("workflow.progress", progress_event)
+            self._progress_buffer.append(("workflow.progress", progress_event))
+
+    async def _flush_progress_loop(self):
+        """Periodically flush buffered progress events until cancelled."""
+        while True:
+            await asyncio.sleep(self.PROGRESS_FLUSH_INTERVAL)
+            await self._flush_progress()
+
+    async def _flush_progress(self):
+        """Publish buffered progress events in pipelined batches."""
+        while self._progress_buffer:
+            batch = self._progress_buffer[: self.PROGRESS_BATCH_SIZE]
+            for _, event in batch:
+                if "timestamp" not in event:
+                    event["timestamp"] = _iso_timestamp(event["timestamp_ns"])
+            try:
+                if self.progress_sink == "stream":
+                    await self.mesh.add_to_stream_many(
+                        f"workflow.progress.{self.workflow_id}",
+                        [event for _, event in batch],
+                        maxlen=self.PROGRESS_STREAM_MAXLEN,
+                    )
+                else:
+                    await self.mesh.publish_many(batch)
+            except Exception as e:
+                # Progress is best-effort; never fail the workflow over it
+                logger.warning(f"Failed to publish workflow progress: {e}")
+            # Dropped only once sent, so a flush cancelled mid-send is retried
+            del self._progress_buffer[: len(batch)]
+
+    @property
+    def intervention_channel(self) -> str:
+        """Channel that external agents publish intervention requests to."""
+        return f"workflow.intervention.{self.workflow_id}"
+
+    def _on_intervention(self, event: Event):
+        """Queue an intervention request received from the event mesh.
+
+        Args:
+            event: Event whose data names the agent to route to next, as
+                {"agent_id": "<instance id>"}
+        """
+        data = event.data if isinstance(event.data, dict) else {}
+        agent_id = data.get("agent_id")
+        if agent_id in self.agent_instances:
+            self._interventions.append(agent_id)
+        else:
+            logger.warning(f"Ignoring intervention for unknown agent {agent_id!r}")
 
     async def _check_intervention(self, agent_id: str, data: Any) -> str | None:
-        """Check for external intervention requests."""
-        # This will be implemented with intervention system
+        """Check for external intervention requests.
+
+        Requests are queued by _on_intervention as they arrive, so this only
+        pops the oldest one without any network round trip.
+
+        Returns:
+            Agent ID to route to instead, or None
+        """
+        if self._interventions:
+            return self._interventions.popleft()
         return None
 
     def _get_agent_config(self, agent_id: str) -> AgentConfig:
         """Get configuration for an agent."""
-        for config in self.agents:
-            if config.instance_id == agent_id:
-                return config
-        raise ValueError(f"No configuration for agent {agent_id}")
+        try:
+            return self._agent_config_by_id[agent_id]
+        except KeyError:
+            raise ValueError(f"No configuration for agent {agent_id}") from None
 
     def _create_error_strategy(
         self, strategy_name: str | None, **options
@@ -607,28 +987,33 @@ class Workflow:
         if strategy_name is None:
             return self.default_error_strategy
 
-        from weaver_ai.agents.error_handling import (
-            FailFast,
-            RetryWithBackoff,
-            SkipOnError,
-        )
-
-        strategies = {
-            "retry": RetryWithBackoff,
-            "fail_fast": FailFast,
-            "skip": SkipOnError,
-        }
-
-        strategy_class = strategies.get(strategy_name, RetryWithBackoff)
+        strategy_class = _ERROR_STRATEGIES.get(strategy_name, RetryWithBackoff)
         return strategy_class(**options)
 
     async def _cleanup(self):
         """Cleanup workflow resources."""
-        # Cleanup agents
-        for agent in self.agent_instances.values():
-            if hasattr(agent, "cleanup"):
-                await agent.cleanup()
+        # Stop the progress flusher and send whatever is still buffered
+        if self._progress_flush_task:
+            self._progress_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._progress_flush_task
+            self._progress_flush_task = None
+        if self._progress_buffer and self.mesh:
+            await self._flush_progress()
+
+        # Cleanup agents concurrently; one failure must not skip the others
+        agents = {
+            agent_id: agent
+            for agent_id, agent in self.agent_instances.items()
+            if hasattr(agent, "cleanup")
+        }
+        results = await asyncio.gather(
+            *(agent.cleanup() for agent in agents.values()), return_exceptions=True
+        )
+        for agent_id, outcome in zip(agents, results, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Cleanup failed for agent {agent_id}: {outcome}")
 
-        # Close connections
-        if self.mesh:
-            await self.mesh.close()
+        # Close connections, unless kept open for further runs
+        if not self._keep_connections:
+            await self.aclose()